@@ -3,17 +3,29 @@ Pocket Money Tracker - Desktop Application
 A Python app to monitor pocket money saving for kids
 """
 
+import atexit
 import json
+import mmap
+import operator
 import os
+import queue
+import re
+import threading
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 import customtkinter as ctk
-from tkinter import messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+import tkinter as tk
+from tkinter import font as tkfont, messagebox, ttk
+
+try:
+    import orjson  # optional, much faster than the json module
+except ImportError:
+    orjson = None
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("light")
@@ -36,36 +48,256 @@ COLORS = {
     "border": "#e2e8f0",
 }
 
+_MONTH_NAMES_FULL = ("January", "February", "March", "April", "May", "June",
+                     "July", "August", "September", "October", "November", "December")
+_MONTH_NAMES_SHORT = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                      "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _is_long_iso_year(year: int) -> bool:
+    """Whether an ISO year has 53 weeks (closed form, no datetime needed)."""
+    def p(y):
+        return (y + y // 4 - y // 100 + y // 400) % 7
+    return p(year) == 4 or p(year - 1) == 3
+
+
+# Data files above this size are parsed straight from an mmap (orjson only)
+_MMAP_THRESHOLD = 64 * 1024
+
+# Period keys: "2024-W03", "2024-BW02", "2024-Q1" or "2024-05"
+_PERIOD_KEY_RE = re.compile(r"^(\d+)-(W|BW|Q|)(\d+)$")
+_PERIOD_KEY_PREFIXES = {
+    "W": ("weekly", "week"),
+    "BW": ("biweekly", "biweek"),
+    "Q": ("quarterly", "quarter"),
+    "": ("monthly", "month"),
+}
+
+# Period type -> name of the field holding the week/biweek/quarter/month number
+_PERIOD_FIELDS = {"weekly": "week", "biweekly": "biweek", "quarterly": "quarter", "monthly": "month"}
+
+# Bit (year - 1970) is set for 53-week ISO years in the range the app realistically deals with
+_ISO53_FIRST, _ISO53_LAST = 1970, 2100
+_ISO53 = sum(1 << (y - _ISO53_FIRST) for y in range(_ISO53_FIRST, _ISO53_LAST + 1) if _is_long_iso_year(y))
+
+
+def _to_cents(amount: float) -> int:
+    """Convert a euro amount (stored with 2 decimals) to integer cents."""
+    return round(amount * 100)
+
+
+def _parse_float(text: str) -> float:
+    """Parse a number typed by the user, accepting "," as the decimal separator."""
+    return float(text.strip().replace(",", "."))
+
+
+def _period_tuple(period: dict) -> Tuple[str, int, int]:
+    """Return a period dict as a hashable (type, year, index) tuple."""
+    period_type = period["type"]
+    return period_type, period["year"], period[_PERIOD_FIELDS.get(period_type, "month")]
+
+
+# Sort key for entries: zero-padded period keys sort chronologically as
+# strings, and itemgetter avoids a Python-level call per comparison
+_entry_period = operator.itemgetter("period")
+
+
+def _insort_by_period(entries: list, entry: dict):
+    """Insert entry into period-sorted entries, after any with the same period.
+    
+    Same as bisect.insort(..., key=_entry_period), which needs Python 3.10.
+    """
+    period = entry["period"]
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if period < entries[mid]["period"]:
+            hi = mid
+        else:
+            lo = mid + 1
+    entries.insert(lo, entry)
+
 
 class DataManager:
-    """Handles all data operations with the JSON file."""
+    """Handles all data operations with the JSON file.
+    
+    The file is parsed once on startup and kept in memory; reads are served
+    from the cached dict and every change is written back to disk, or once
+    at the end of a session() block. The file stays a single JSON document
+    so it can be copied between the Python and PHP versions.
+    
+    Disk writes run on a background writer thread so the UI never waits on
+    fsync. Each write is a full snapshot, so the writer only ever keeps the
+    newest one; call close() before exiting to wait for it.
+    """
     
     def __init__(self, data_file: str = "data/data.json"):
         self.data_file = Path(data_file)
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Create data directory and file if they don't exist."""
-        self.data_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.data_file.exists():
-            initial_data = {
-                "kids": [],
-                "settings": {"period": "monthly", "currency": "EUR"}
-            }
-            self._save_data(initial_data)
-    
-    def _load_data(self) -> dict:
-        """Load data from JSON file."""
+        self._session_depth = 0
+        self._dirty = False
+        self._dir_ready = False
+        self._write_cond = threading.Condition()
+        self._next_payload = None
+        self._write_error = None
+        # Newest snapshot whose write failed, until a later write succeeds
+        self._failed_payload = None
+        self._closed = False
+        self._writer = None
+        self._data = self._load_data_from_disk()
+        self._build_index()
+    
+    def _load_data_from_disk(self) -> dict:
+        """Load data from JSON file (defaults if it doesn't exist yet)."""
         try:
+            if orjson is not None:
+                if self.data_file.stat().st_size > _MMAP_THRESHOLD:
+                    with open(self.data_file, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                            memoryview(mm) as buf:
+                        return orjson.loads(buf)
+                return orjson.loads(self.data_file.read_bytes())
             with open(self.data_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (json.JSONDecodeError, FileNotFoundError):
             return {"kids": [], "settings": {"period": "monthly", "currency": "EUR"}}
     
+    def _build_index(self):
+        """Index kids and their entries by id (the dicts are shared with self._data).
+        
+        Each kid's entries are also sorted by period once here and kept in
+        order by the mutating methods.
+        """
+        self._kids_by_id = {}
+        self._entries_by_id = {}
+        self._periods_by_kid = {}
+        self._totals_cache = {}
+        self._columns_cache = {}
+        self._chart_cache = {}
+        self._rows_cache = {}
+        for kid in self._data.get("kids", []):
+            entries = kid.get("entries", [])
+            entries.sort(key=_entry_period)
+            self._kids_by_id[kid["id"]] = kid
+            self._entries_by_id[kid["id"]] = {e["id"]: e for e in entries}
+            self._periods_by_kid[kid["id"]] = {e["period"] for e in entries}
+    
+    def _load_data(self) -> dict:
+        """Return the in-memory data (mutations must be followed by _save_data)."""
+        return self._data
+    
     def _save_data(self, data: dict):
-        """Save data to JSON file."""
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        """Save data to JSON file, or defer the write while a session is open."""
+        if self._session_depth:
+            self._dirty = True
+            return
+        self._write_data(data)
+    
+    def _write_data(self, data: dict):
+        """Serialize data and hand the bytes to the background writer.
+        
+        Serializing happens here, on the caller's thread, so the writer never
+        sees the dict while it is being mutated. A payload the writer hasn't
+        picked up yet is replaced, since the new one supersedes it.
+        
+        Never raises for an earlier failed write: those are reported
+        through take_write_error(), and this newer snapshot is the retry.
+        """
+        if self._closed:
+            raise RuntimeError("DataManager is closed")
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+        with self._write_cond:
+            self._next_payload = payload
+            self._write_cond.notify()
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="data-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+        self._dirty = False
+    
+    def take_write_error(self) -> Optional[Exception]:
+        """Return and clear the error from the last failed background write.
+        
+        This is how failed saves are reported: the UI polls it so the user
+        hears about a failure when it happens, and mutators never raise for
+        it. The failed snapshot is retried by the next save or close().
+        """
+        with self._write_cond:
+            error, self._write_error = self._write_error, None
+        return error
+    
+    def _writer_loop(self):
+        """Write the newest payload until close() is called (writer thread)."""
+        cond = self._write_cond
+        while True:
+            with cond:
+                while self._next_payload is None and not self._closed:
+                    cond.wait()
+                payload, self._next_payload = self._next_payload, None
+            if payload is None:
+                return
+            try:
+                self._write_payload(payload)
+            except Exception as e:
+                with cond:
+                    self._write_error = e
+                    self._failed_payload = payload
+                    # The directory may have gone away; recreate it on retry
+                    self._dir_ready = False
+            else:
+                self._failed_payload = None
+    
+    def _write_payload(self, payload: bytes):
+        """Write the JSON file in a single write, replacing it atomically (writer thread).
+        
+        The data directory is created on the first write rather than at
+        startup, so an existing data file costs no extra syscalls.
+        """
+        if not self._dir_ready:
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        tmp_file = self.data_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+    
+    def _flush(self):
+        """Write pending changes to disk."""
+        if self._dirty:
+            self._write_data(self._data)
+    
+    def close(self):
+        """Flush pending changes and wait for the background writer to finish."""
+        if self._closed:
+            return
+        self._flush()
+        with self._write_cond:
+            self._closed = True
+            self._write_cond.notify()
+        if self._writer is not None:
+            self._writer.join()
+        # Only the newest snapshot matters: an error the UI hasn't polled yet
+        # is dropped if a later write succeeded, and the failed snapshot is
+        # retried (raising if it fails again) otherwise
+        self.take_write_error()
+        if self._failed_payload is not None:
+            payload, self._failed_payload = self._failed_payload, None
+            self._write_payload(payload)
+    
+    @contextmanager
+    def session(self):
+        """Group several changes into a single write on exit (sessions nest)."""
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            self._session_depth -= 1
+            if not self._session_depth:
+                self._flush()
     
     def get_settings(self) -> dict:
         """Get application settings."""
@@ -82,7 +314,7 @@ class DataManager:
         data = self._load_data()
         kids = []
         for kid in data.get("kids", []):
-            totals = self._calculate_totals(kid)
+            totals = self._get_totals(kid)
             kids.append({
                 "id": kid["id"],
                 "name": kid["name"],
@@ -94,16 +326,15 @@ class DataManager:
     
     def get_kid(self, kid_id: str) -> Optional[dict]:
         """Get a specific kid by ID with full details."""
-        data = self._load_data()
-        for kid in data.get("kids", []):
-            if kid["id"] == kid_id:
-                totals = self._calculate_totals(kid)
-                return {
-                    **kid,
-                    "totals": totals,
-                    "entries": totals.get("entries", [])
-                }
-        return None
+        kid = self._kids_by_id.get(kid_id)
+        if kid is None:
+            return None
+        totals = self._get_totals(kid)
+        return {
+            **kid,
+            "totals": totals,
+            "entries": totals.get("entries", [])
+        }
     
     def add_kid(self, name: str) -> dict:
         """Add a new kid."""
@@ -116,167 +347,279 @@ class DataManager:
             "entries": []
         }
         data["kids"].append(new_kid)
+        self._kids_by_id[new_kid["id"]] = new_kid
+        self._entries_by_id[new_kid["id"]] = {}
+        self._periods_by_kid[new_kid["id"]] = set()
         self._save_data(data)
         return new_kid
     
     def update_kid(self, kid_id: str, name: str) -> bool:
         """Update a kid's name."""
-        data = self._load_data()
-        for kid in data["kids"]:
-            if kid["id"] == kid_id:
-                kid["name"] = name
-                self._save_data(data)
-                return True
-        return False
+        kid = self._kids_by_id.get(kid_id)
+        if kid is None:
+            return False
+        kid["name"] = name
+        self._save_data(self._data)
+        return True
     
     def delete_kid(self, kid_id: str) -> bool:
         """Delete a kid."""
-        data = self._load_data()
-        original_len = len(data["kids"])
-        data["kids"] = [k for k in data["kids"] if k["id"] != kid_id]
-        if len(data["kids"]) < original_len:
-            self._save_data(data)
-            return True
-        return False
+        kid = self._kids_by_id.pop(kid_id, None)
+        if kid is None:
+            return False
+        del self._entries_by_id[kid_id]
+        del self._periods_by_kid[kid_id]
+        # Drop everything derived from this kid's entries, not just the totals
+        for cache in (self._totals_cache, self._columns_cache, self._chart_cache, self._rows_cache):
+            cache.pop(kid_id, None)
+        self._data["kids"] = [k for k in self._data["kids"] if k is not kid]
+        self._save_data(self._data)
+        return True
     
     def update_allocation(self, kid_id: str, spent: float, saved: float, 
                           given: float, interest_rate: float) -> bool:
         """Update a kid's allocation settings."""
-        data = self._load_data()
-        for kid in data["kids"]:
-            if kid["id"] == kid_id:
-                kid["allocation"] = {"spent": spent, "saved": saved, "given": given}
-                kid["interestRate"] = interest_rate
-                self._save_data(data)
-                return True
-        return False
+        kid = self._kids_by_id.get(kid_id)
+        if kid is None:
+            return False
+        kid["allocation"] = {"spent": spent, "saved": saved, "given": given}
+        kid["interestRate"] = interest_rate
+        self._totals_cache.pop(kid_id, None)
+        self._save_data(self._data)
+        return True
     
     def add_entry(self, kid_id: str, period: str, period_type: str, 
                   amount: float, interest_rate: float,
                   spent_pct: float, saved_pct: float, given_pct: float,
                   used_from_saved: float = 0) -> Optional[dict]:
         """Add a money entry for a kid."""
-        data = self._load_data()
-        for kid in data["kids"]:
-            if kid["id"] == kid_id:
-                # Check for duplicate period
-                for entry in kid.get("entries", []):
-                    if entry["period"] == period:
-                        return None  # Duplicate
-                
-                new_entry = {
-                    "id": f"entry_{uuid.uuid4().hex[:12]}",
-                    "period": period,
-                    "periodType": period_type,
-                    "amount": amount,
-                    "spentPercent": spent_pct,
-                    "savedPercent": saved_pct,
-                    "givenPercent": given_pct,
-                    "spent": round(amount * spent_pct / 100, 2),
-                    "saved": round(amount * saved_pct / 100, 2),
-                    "given": round(amount * given_pct / 100, 2),
-                    "usedFromSaved": round(used_from_saved, 2),
-                    "interestRate": interest_rate,
-                    "createdAt": datetime.now().isoformat()
-                }
-                
-                if "entries" not in kid:
-                    kid["entries"] = []
-                kid["entries"].append(new_entry)
-                self._save_data(data)
-                return new_entry
-        return None
+        kid = self._kids_by_id.get(kid_id)
+        if kid is None:
+            return None
+        
+        periods = self._periods_by_kid[kid_id]
+        if period in periods:
+            return None  # Duplicate
+        
+        new_entry = {
+            "id": f"entry_{uuid.uuid4().hex[:12]}",
+            "period": period,
+            "periodType": period_type,
+            "amount": amount,
+            "spentPercent": spent_pct,
+            "savedPercent": saved_pct,
+            "givenPercent": given_pct,
+            "spent": round(amount * spent_pct / 100, 2),
+            "saved": round(amount * saved_pct / 100, 2),
+            "given": round(amount * given_pct / 100, 2),
+            "usedFromSaved": round(used_from_saved, 2),
+            "interestRate": interest_rate,
+            "createdAt": datetime.now().isoformat()
+        }
+        
+        if "entries" not in kid:
+            kid["entries"] = []
+        _insort_by_period(kid["entries"], new_entry)
+        self._entries_by_id[kid_id][new_entry["id"]] = new_entry
+        periods.add(period)
+        self._totals_cache.pop(kid_id, None)
+        self._save_data(self._data)
+        return new_entry
     
     def update_entry(self, kid_id: str, entry_id: str, amount: float,
                      spent_pct: float, saved_pct: float, given_pct: float,
                      interest_rate: float, used_from_saved: float = 0,
                      period: str = None, period_type: str = None) -> bool:
         """Update an existing entry."""
-        data = self._load_data()
-        for kid in data["kids"]:
-            if kid["id"] == kid_id:
-                for entry in kid.get("entries", []):
-                    if entry["id"] == entry_id:
-                        # Check if new period conflicts with existing entries
-                        if period and period != entry["period"]:
-                            for other_entry in kid.get("entries", []):
-                                if other_entry["id"] != entry_id and other_entry["period"] == period:
-                                    return False  # Conflict
-                            entry["period"] = period
-                            if period_type:
-                                entry["periodType"] = period_type
-                        
-                        entry["amount"] = amount
-                        entry["spentPercent"] = spent_pct
-                        entry["savedPercent"] = saved_pct
-                        entry["givenPercent"] = given_pct
-                        entry["spent"] = round(amount * spent_pct / 100, 2)
-                        entry["saved"] = round(amount * saved_pct / 100, 2)
-                        entry["given"] = round(amount * given_pct / 100, 2)
-                        entry["usedFromSaved"] = round(used_from_saved, 2)
-                        entry["interestRate"] = interest_rate
-                        entry["updatedAt"] = datetime.now().isoformat()
-                        self._save_data(data)
-                        return True
-        return False
+        entry = self._entries_by_id.get(kid_id, {}).get(entry_id)
+        if entry is None:
+            return False
+        
+        # Check if new period conflicts with existing entries
+        if period and period != entry["period"]:
+            periods = self._periods_by_kid[kid_id]
+            if period in periods:
+                return False  # Conflict
+            periods.discard(entry["period"])
+            periods.add(period)
+            entry["period"] = period
+            if period_type:
+                entry["periodType"] = period_type
+            self._kids_by_id[kid_id]["entries"].sort(key=_entry_period)
+        
+        entry["amount"] = amount
+        entry["spentPercent"] = spent_pct
+        entry["savedPercent"] = saved_pct
+        entry["givenPercent"] = given_pct
+        entry["spent"] = round(amount * spent_pct / 100, 2)
+        entry["saved"] = round(amount * saved_pct / 100, 2)
+        entry["given"] = round(amount * given_pct / 100, 2)
+        entry["usedFromSaved"] = round(used_from_saved, 2)
+        entry["interestRate"] = interest_rate
+        entry["updatedAt"] = datetime.now().isoformat()
+        self._totals_cache.pop(kid_id, None)
+        self._save_data(self._data)
+        return True
     
     def delete_entry(self, kid_id: str, entry_id: str) -> bool:
         """Delete an entry."""
-        data = self._load_data()
-        for kid in data["kids"]:
-            if kid["id"] == kid_id:
-                original_len = len(kid.get("entries", []))
-                kid["entries"] = [e for e in kid.get("entries", []) if e["id"] != entry_id]
-                if len(kid["entries"]) < original_len:
-                    self._save_data(data)
-                    return True
-        return False
+        entry = self._entries_by_id.get(kid_id, {}).pop(entry_id, None)
+        if entry is None:
+            return False
+        self._periods_by_kid[kid_id].discard(entry["period"])
+        kid = self._kids_by_id[kid_id]
+        kid["entries"] = [e for e in kid["entries"] if e is not entry]
+        self._totals_cache.pop(kid_id, None)
+        self._save_data(self._data)
+        return True
+    
+    def _get_totals(self, kid: dict) -> dict:
+        """Get a kid's totals, recalculating only after their entries changed."""
+        totals = self._totals_cache.get(kid["id"])
+        if totals is None:
+            totals = self._totals_cache[kid["id"]] = self._calculate_totals(kid)
+        return totals
+    
+    # Numeric fields of the computed entries exposed by get_entry_columns
+    ENTRY_COLUMNS = ("amount", "spent", "saved", "given", "usedFromSaved",
+                     "interestEarned", "runningSaved")
+    
+    def get_entry_columns(self, kid_id: str) -> Optional[dict]:
+        """Get a kid's computed entries as NumPy arrays, one per field in ENTRY_COLUMNS.
+        
+        Rows are in period order; "period" holds the matching period keys.
+        The arrays are built from the cached totals and reused until the
+        kid's entries change, so they must not be modified.
+        """
+        # numpy ships with matplotlib; only load it once something needs columns
+        import numpy as np
+        
+        kid = self._kids_by_id.get(kid_id)
+        if kid is None:
+            return None
+        totals = self._get_totals(kid)
+        cached = self._columns_cache.get(kid_id)
+        if cached is not None and cached[0] is totals:
+            return cached[1]
+        
+        entries = totals["entries"]
+        columns = {
+            key: np.fromiter((e.get(key, 0) for e in entries), dtype=float, count=len(entries))
+            for key in self.ENTRY_COLUMNS
+        }
+        columns["period"] = [e["period"] for e in entries]
+        self._columns_cache[kid_id] = (totals, columns)
+        return columns
+    
+    def get_chart_series(self, kid_id: str) -> Optional[dict]:
+        """Get the savings chart data for a kid, cached until their entries change.
+        
+        Returns labels plus cum_spent, cum_given and saved arrays, which
+        must not be modified.
+        """
+        columns = self.get_entry_columns(kid_id)
+        if columns is None:
+            return None
+        cached = self._chart_cache.get(kid_id)
+        if cached is not None and cached[0] is columns:
+            return cached[1]
+        
+        totals = self._totals_cache[kid_id]
+        series = {
+            "labels": [e["periodShort"] for e in totals["entries"]],
+            "cum_spent": columns["spent"].cumsum(),
+            "cum_given": columns["given"].cumsum(),
+            "saved": columns["runningSaved"],
+        }
+        self._chart_cache[kid_id] = (columns, series)
+        return series
+    
+    def get_entry_rows(self, kid_id: str) -> Optional[list]:
+        """Get a kid's entries as formatted history table rows, newest first.
+        
+        Each row is (entry_id, values, used_from_saved) with values holding
+        the display strings. Rows are formatted once per change to the
+        kid's entries and reused until then, so they must not be modified.
+        """
+        kid = self._kids_by_id.get(kid_id)
+        if kid is None:
+            return None
+        totals = self._get_totals(kid)
+        cached = self._rows_cache.get(kid_id)
+        if cached is not None and cached[0] is totals:
+            return cached[1]
+        
+        rows = []
+        for entry in reversed(totals["entries"]):
+            # Look up entry.get once per row rather than once per field
+            get = entry.get
+            used_from_saved = get("usedFromSaved", 0)
+            rows.append((entry["id"], (
+                entry["periodShort"],
+                f"€{entry['amount']:.2f}",
+                f"{get('spentPercent', 0):.0f}% · €{entry['spent']:.2f}",
+                f"{get('savedPercent', 0):.0f}% · €{entry['saved']:.2f}",
+                f"{get('givenPercent', 0):.0f}% · €{entry['given']:.2f}",
+                f"-€{used_from_saved:.2f}" if used_from_saved > 0 else "€0.00",
+                f"{get('interestRate', 0):.1f}% · +€{get('interestEarned', 0):.2f}",
+                f"€{get('runningSaved', 0):.2f}",
+            ), used_from_saved > 0))
+        self._rows_cache[kid_id] = (totals, rows)
+        return rows
     
     def _calculate_totals(self, kid: dict) -> dict:
-        """Calculate totals with interest for a kid."""
-        total_spent = 0
-        total_given = 0
+        """Calculate totals with interest for a kid (entries are sorted by period).
+        
+        Spent, given and used amounts are summed in integer cents so long
+        histories don't accumulate float error; the saved balance stays a
+        float because interest produces fractions of a cent.
+        """
+        spent_cents = 0
+        given_cents = 0
+        used_cents = 0
         total_interest = 0
-        total_used_from_saved = 0
-        
-        entries = kid.get("entries", [])
-        sorted_entries = sorted(entries, key=lambda x: x["period"])
         
         running_saved = 0
         processed_entries = []
+        append_entry = processed_entries.append
         
-        for entry in sorted_entries:
+        for entry in kid.get("entries", []):
+            # Interest on what was saved before this entry (most entries use 0%)
             interest_rate = entry.get("interestRate", 0)
-            interest_amount = running_saved * (interest_rate / 100)
-            total_interest += interest_amount
-            running_saved += interest_amount
+            if interest_rate:
+                interest_amount = running_saved * (interest_rate / 100)
+                total_interest += interest_amount
+                running_saved += interest_amount
+            else:
+                interest_amount = 0.0
             
-            total_spent += entry["spent"]
+            spent_cents += _to_cents(entry["spent"])
             running_saved += entry["saved"]
-            total_given += entry["given"]
+            given_cents += _to_cents(entry["given"])
             
             # Subtract used from saved
             used_from_saved = entry.get("usedFromSaved", 0)
             running_saved -= used_from_saved
-            total_used_from_saved += used_from_saved
+            used_cents += _to_cents(used_from_saved)
             
-            processed_entry = {
+            append_entry({
                 **entry,
                 "interestEarned": round(interest_amount, 2),
-                "runningSaved": round(running_saved, 2)
-            }
-            processed_entries.append(processed_entry)
+                "runningSaved": round(running_saved, 2),
+                # Display-only, never written back to the data file
+                "periodShort": _fmt_period_short(entry["period"])
+            })
         
         # Add used from saved to total spent
-        total_spent_with_used = total_spent + total_used_from_saved
+        spent_with_used_cents = spent_cents + used_cents
         
         return {
-            "totalSpent": round(total_spent_with_used, 2),
+            "totalSpent": spent_with_used_cents / 100,
             "totalSaved": round(running_saved, 2),
-            "totalGiven": round(total_given, 2),
+            "totalGiven": given_cents / 100,
             "totalInterest": round(total_interest, 2),
-            "totalUsedFromSaved": round(total_used_from_saved, 2),
-            "grandTotal": round(total_spent_with_used + running_saved + total_given, 2),
+            "totalUsedFromSaved": used_cents / 100,
+            "grandTotal": round((spent_with_used_cents + given_cents) / 100 + running_saved, 2),
             "entries": processed_entries
         }
 
@@ -292,19 +635,27 @@ class PeriodHelper:
     @staticmethod
     def get_max_weeks_in_year(year: int) -> int:
         """Get the maximum number of weeks in a year."""
-        dec_28 = datetime(year, 12, 28)
-        return dec_28.isocalendar()[1]
+        if _ISO53_FIRST <= year <= _ISO53_LAST:
+            return 52 + ((_ISO53 >> (year - _ISO53_FIRST)) & 1)
+        return 53 if _is_long_iso_year(year) else 52
+    
+    @staticmethod
+    def get_max_biweeks_in_year(year: int) -> int:
+        """Get the maximum number of biweekly periods in a year."""
+        return (PeriodHelper.get_max_weeks_in_year(year) + 1) // 2
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def get_week_dates(week: int, year: int) -> Tuple[datetime, datetime]:
         """Get start and end dates for a given week number and year."""
-        jan_4 = datetime(year, 1, 4)
-        start_of_week_1 = jan_4 - timedelta(days=jan_4.weekday())
-        start_date = start_of_week_1 + timedelta(weeks=week - 1)
-        end_date = start_date + timedelta(days=6)
-        return start_date, end_date
+        if 1 <= week <= PeriodHelper.get_max_weeks_in_year(year):
+            return datetime.fromisocalendar(year, week, 1), datetime.fromisocalendar(year, week, 7)
+        # Weeks past the end of the year (e.g. the tail of the last biweek) roll over
+        start_date = datetime.fromisocalendar(year, 1, 1) + timedelta(weeks=week - 1)
+        return start_date, start_date + timedelta(days=6)
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def get_biweek_dates(biweek: int, year: int) -> Tuple[datetime, datetime]:
         """Get start and end dates for a given bi-weekly period."""
         start_week = (biweek - 1) * 2 + 1
@@ -314,6 +665,7 @@ class PeriodHelper:
         return start_date, end_date
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def get_quarter_dates(quarter: int, year: int) -> Tuple[datetime, datetime]:
         """Get start and end dates for a given quarter."""
         start_month = (quarter - 1) * 3 + 1
@@ -326,6 +678,7 @@ class PeriodHelper:
         return start_date, end_date
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def get_month_dates(month: int, year: int) -> Tuple[datetime, datetime]:
         """Get start and end dates for a given month."""
         start_date = datetime(year, month, 1)
@@ -367,92 +720,53 @@ class PeriodHelper:
     @staticmethod
     def get_period_key(period: dict) -> str:
         """Get period key string."""
-        if period["type"] == "weekly":
-            return f"{period['year']}-W{period['week']:02d}"
-        elif period["type"] == "biweekly":
-            return f"{period['year']}-BW{period['biweek']:02d}"
-        elif period["type"] == "quarterly":
-            return f"{period['year']}-Q{period['quarter']}"
+        return PeriodHelper._get_period_key(*_period_tuple(period))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_period_key(period_type: str, year: int, index: int) -> str:
+        """Cached get_period_key for a (type, year, index) tuple."""
+        if period_type == "weekly":
+            return f"{year}-W{index:02d}"
+        elif period_type == "biweekly":
+            return f"{year}-BW{index:02d}"
+        elif period_type == "quarterly":
+            return f"{year}-Q{index}"
         else:  # monthly
-            return f"{period['year']}-{period['month']:02d}"
+            return f"{year}-{index:02d}"
     
     @staticmethod
     def parse_period_key(period_key: str) -> dict:
         """Parse a period key back to a period dict."""
-        if "-W" in period_key:
-            year, week = period_key.split("-W")
-            return {"year": int(year), "week": int(week), "type": "weekly"}
-        elif "-BW" in period_key:
-            year, biweek = period_key.split("-BW")
-            return {"year": int(year), "biweek": int(biweek), "type": "biweekly"}
-        elif "-Q" in period_key:
-            year, quarter = period_key.split("-Q")
-            return {"year": int(year), "quarter": int(quarter), "type": "quarterly"}
-        else:
-            year, month = period_key.split("-")
-            return {"year": int(year), "month": int(month), "type": "monthly"}
+        return PeriodHelper._parse_period_key(period_key).copy()
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_period_key(period_key: str) -> dict:
+        """Cached parse_period_key; the shared result must not be mutated."""
+        match = _PERIOD_KEY_RE.match(period_key)
+        if match is None:
+            raise ValueError(f"Invalid period key: {period_key!r}")
+        year, prefix, number = match.groups()
+        period_type, field = _PERIOD_KEY_PREFIXES[prefix]
+        return {"year": int(year), field: int(number), "type": period_type}
     
     @staticmethod
     def format_period_display(period: dict, include_dates: bool = True) -> str:
         """Format period for display with optional date range."""
-        year = period.get("year", datetime.now().year)
-        
-        if period["type"] == "weekly":
-            week = period["week"]
-            base = f"Week {week}, {year}"
-            if include_dates:
-                start, end = PeriodHelper.get_week_dates(week, year)
-                return f"{base}\n({PeriodHelper.format_date_range(start, end)})"
-            return base
-        elif period["type"] == "biweekly":
-            biweek = period["biweek"]
-            base = f"Period {biweek}, {year}"
-            if include_dates:
-                start, end = PeriodHelper.get_biweek_dates(biweek, year)
-                return f"{base}\n({PeriodHelper.format_date_range(start, end)})"
-            return base
-        elif period["type"] == "quarterly":
-            quarter = period["quarter"]
-            base = f"Q{quarter} {year}"
-            if include_dates:
-                start, end = PeriodHelper.get_quarter_dates(quarter, year)
-                return f"{base}\n({PeriodHelper.format_date_range(start, end)})"
-            return base
-        else:  # monthly
-            month = period["month"]
-            month_names = ["January", "February", "March", "April", "May", "June",
-                          "July", "August", "September", "October", "November", "December"]
-            base = f"{month_names[month - 1]} {year}"
-            if include_dates:
-                start, end = PeriodHelper.get_month_dates(month, year)
-                return f"{base}\n({start.day}-{end.day} {start.strftime('%b')})"
-            return base
+        if "year" not in period:
+            period = {**period, "year": datetime.now().year}
+        return _fmt_period_label(PeriodHelper.get_period_key(period), include_dates)
     
     @staticmethod
     def format_period_label(period_key: str, include_dates: bool = False) -> str:
         """Format period key for display."""
-        period = PeriodHelper.parse_period_key(period_key)
-        return PeriodHelper.format_period_display(period, include_dates)
+        return _fmt_period_label(period_key, include_dates)
     
     @staticmethod
     def format_period_short(period_key: str) -> str:
         """Format period key for short display (table)."""
-        period = PeriodHelper.parse_period_key(period_key)
-        year = period.get("year", datetime.now().year)
-        
-        if period["type"] == "weekly":
-            start, end = PeriodHelper.get_week_dates(period["week"], year)
-            return f"W{period['week']} ({start.strftime('%d/%m')}-{end.strftime('%d/%m')})"
-        elif period["type"] == "biweekly":
-            start, end = PeriodHelper.get_biweek_dates(period["biweek"], year)
-            return f"BW{period['biweek']} ({start.strftime('%d/%m')}-{end.strftime('%d/%m')})"
-        elif period["type"] == "quarterly":
-            start, end = PeriodHelper.get_quarter_dates(period["quarter"], year)
-            return f"Q{period['quarter']} ({start.strftime('%b')}-{end.strftime('%b %Y')})"
-        else:
-            month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-            return f"{month_names[period['month'] - 1]} {year}"
+        return _fmt_period_short(period_key)
     
     @staticmethod
     def navigate_period(period: dict, direction: int) -> dict:
@@ -470,11 +784,11 @@ class PeriodHelper:
                 new_period["week"] = 1
                 new_period["year"] += 1
         elif period["type"] == "biweekly":
-            max_biweeks = (PeriodHelper.get_max_weeks_in_year(year) + 1) // 2
+            max_biweeks = PeriodHelper.get_max_biweeks_in_year(year)
             new_period["biweek"] += direction
             if new_period["biweek"] < 1:
                 new_period["year"] -= 1
-                new_period["biweek"] = (PeriodHelper.get_max_weeks_in_year(new_period["year"]) + 1) // 2
+                new_period["biweek"] = PeriodHelper.get_max_biweeks_in_year(new_period["year"])
             elif new_period["biweek"] > max_biweeks:
                 new_period["biweek"] = 1
                 new_period["year"] += 1
@@ -498,6 +812,108 @@ class PeriodHelper:
         return new_period
 
 
+@lru_cache(maxsize=4096)
+def _fmt_period_label(period_key: str, include_dates: bool) -> str:
+    """Format a period key for display with optional date range (cached)."""
+    period = PeriodHelper._parse_period_key(period_key)
+    year = period["year"]
+    
+    if period["type"] == "weekly":
+        week = period["week"]
+        base = f"Week {week}, {year}"
+        if include_dates:
+            start, end = PeriodHelper.get_week_dates(week, year)
+            return f"{base}\n({PeriodHelper.format_date_range(start, end)})"
+        return base
+    elif period["type"] == "biweekly":
+        biweek = period["biweek"]
+        base = f"Period {biweek}, {year}"
+        if include_dates:
+            start, end = PeriodHelper.get_biweek_dates(biweek, year)
+            return f"{base}\n({PeriodHelper.format_date_range(start, end)})"
+        return base
+    elif period["type"] == "quarterly":
+        quarter = period["quarter"]
+        base = f"Q{quarter} {year}"
+        if include_dates:
+            start, end = PeriodHelper.get_quarter_dates(quarter, year)
+            return f"{base}\n({PeriodHelper.format_date_range(start, end)})"
+        return base
+    else:  # monthly
+        month = period["month"]
+        base = f"{_MONTH_NAMES_FULL[month - 1]} {year}"
+        if include_dates:
+            start, end = PeriodHelper.get_month_dates(month, year)
+            return f"{base}\n({start.day}-{end.day} {start.strftime('%b')})"
+        return base
+
+
+@lru_cache(maxsize=4096)
+def _fmt_period_short(period_key: str) -> str:
+    """Format a period key for short display in tables (cached)."""
+    period = PeriodHelper._parse_period_key(period_key)
+    year = period["year"]
+    
+    if period["type"] == "weekly":
+        start, end = PeriodHelper.get_week_dates(period["week"], year)
+        return f"W{period['week']} ({start.strftime('%d/%m')}-{end.strftime('%d/%m')})"
+    elif period["type"] == "biweekly":
+        start, end = PeriodHelper.get_biweek_dates(period["biweek"], year)
+        return f"BW{period['biweek']} ({start.strftime('%d/%m')}-{end.strftime('%d/%m')})"
+    elif period["type"] == "quarterly":
+        start, end = PeriodHelper.get_quarter_dates(period["quarter"], year)
+        return f"Q{period['quarter']} ({start.strftime('%b')}-{end.strftime('%b %Y')})"
+    else:
+        return f"{_MONTH_NAMES_SHORT[period['month'] - 1]} {year}"
+
+
+@lru_cache(maxsize=32)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return a shared CTkFont for (size, weight) instead of building a new one per widget."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+@lru_cache(maxsize=8)
+def _icon(name: str, size: int = 16) -> ctk.CTkImage:
+    """Return a shared white "edit" or "delete" button icon.
+    
+    Drawn with PIL at 4x and scaled down, so buttons show the same glyph on
+    every platform instead of depending on the system's emoji font.
+    """
+    from PIL import Image, ImageDraw
+    
+    s = size * 4
+    image = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    white = (255, 255, 255, 255)
+    if name == "edit":
+        # Pencil along the diagonal: eraser, body, then the tip at the bottom left
+        def band(a, b, half=0.11):
+            return [(s * (a + half), s * (1 - a + half)), (s * (a - half), s * (1 - a - half)),
+                    (s * (b - half), s * (1 - b - half)), (s * (b + half), s * (1 - b + half))]
+        draw.polygon(band(0.74, 0.86), fill=white)
+        draw.polygon(band(0.30, 0.68), fill=white)
+        draw.polygon([(s * 0.41, s * 0.81), (s * 0.19, s * 0.59), (s * 0.10, s * 0.90)], fill=white)
+    elif name == "delete":
+        # Trash can: handle, lid and a body with two slots
+        w = s // 12
+        draw.rectangle([s * 0.38, s * 0.08, s * 0.62, s * 0.20], outline=white, width=w)
+        draw.rectangle([s * 0.12, s * 0.20, s * 0.88, s * 0.30], fill=white)
+        draw.rectangle([s * 0.22, s * 0.34, s * 0.78, s * 0.92], outline=white, width=w)
+        for x in (0.42, 0.58):
+            draw.line([(s * x, s * 0.46), (s * x, s * 0.80)], fill=white, width=w)
+    else:
+        raise ValueError(f"Unknown icon: {name}")
+    image = image.resize((size * 2, size * 2), Image.LANCZOS)
+    return ctk.CTkImage(light_image=image, dark_image=image, size=(size, size))
+
+
+def _set_label_text(label, text: str):
+    """configure(text=...) only when the text changed; CTk redraws on every configure."""
+    if label.cget("text") != text:
+        label.configure(text=text)
+
+
 class KidCard(ctk.CTkFrame):
     """Widget for displaying a kid's summary card."""
     
@@ -517,18 +933,28 @@ class KidCard(ctk.CTkFrame):
         
         self._create_widgets()
         
-        # Bind click to entire card
-        self._bind_click_recursive(self)
-    
-    def _bind_click_recursive(self, widget):
-        """Recursively bind click event to widget and all children except buttons."""
-        widget_class = widget.winfo_class()
-        widget_type = type(widget).__name__
-        # Skip buttons
-        if widget_type not in ("CTkButton",) and widget_class not in ("Button", "TButton"):
-            widget.bind("<Button-1>", lambda e: self._handle_click(e))
-            for child in widget.winfo_children():
-                self._bind_click_recursive(child)
+        # Bind click to entire card: one class binding shared through a bindtag
+        self._click_tag = f"card_{self.kid['id']}"
+        self.bind_class(self._click_tag, "<Button-1>", self._handle_click)
+        self._add_click_tag()
+    
+    def _add_click_tag(self):
+        """Add the card's click bindtag to the card and all children except buttons.
+        
+        Walks the plain Tk children: CTkFrame.winfo_children() hides the
+        internal canvas that covers the frame, and clicks land on it.
+        """
+        stack = [self]
+        while stack:
+            widget = stack.pop()
+            if isinstance(widget, ctk.CTkButton):
+                continue
+            widget.bindtags((self._click_tag,) + widget.bindtags())
+            stack.extend(tk.Misc.winfo_children(widget))
+    
+    def destroy(self):
+        self.unbind_class(self._click_tag, "<Button-1>")
+        super().destroy()
     
     def _handle_click(self, event):
         """Handle click on the card."""
@@ -541,6 +967,12 @@ class KidCard(ctk.CTkFrame):
     def _on_leave(self, event):
         """Handle mouse leave."""
         self.configure(border_color=COLORS["bg"])
+    
+    def _on_edit_click(self):
+        self.on_edit(self.kid["id"], self.kid["name"])
+    
+    def _on_delete_click(self):
+        self.on_delete(self.kid["id"], self.kid["name"])
         
     def _create_widgets(self):
         # Main content frame
@@ -551,29 +983,29 @@ class KidCard(ctk.CTkFrame):
         header = ctk.CTkFrame(content, fg_color="transparent")
         header.pack(fill="x", pady=(0, 10))
         
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             header, 
             text=f"👦 {self.kid['name']}", 
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=COLORS["text"]
         )
-        name_label.pack(side="left")
+        self.name_label.pack(side="left")
         
         # Action buttons
         btn_frame = ctk.CTkFrame(header, fg_color="transparent")
         btn_frame.pack(side="right")
         
         edit_btn = ctk.CTkButton(
-            btn_frame, text="✏️", width=35, height=35,
+            btn_frame, text="", image=_icon("edit"), width=35, height=35,
             fg_color=COLORS["warning"], hover_color="#d97706",
-            command=lambda: self.on_edit(self.kid["id"], self.kid["name"])
+            command=self._on_edit_click
         )
         edit_btn.pack(side="left", padx=2)
         
         delete_btn = ctk.CTkButton(
-            btn_frame, text="🗑️", width=35, height=35,
+            btn_frame, text="", image=_icon("delete"), width=35, height=35,
             fg_color=COLORS["danger"], hover_color="#dc2626",
-            command=lambda: self.on_delete(self.kid["id"], self.kid["name"])
+            command=self._on_delete_click
         )
         delete_btn.pack(side="left", padx=2)
         
@@ -582,10 +1014,11 @@ class KidCard(ctk.CTkFrame):
         totals_frame = ctk.CTkFrame(content, fg_color="transparent")
         totals_frame.pack(fill="x")
         
-        for col, (label, value, color) in enumerate([
-            ("Spent", totals.get("totalSpent", 0), COLORS["spent"]),
-            ("Saved", totals.get("totalSaved", 0), COLORS["saved"]),
-            ("Given", totals.get("totalGiven", 0), COLORS["given"])
+        self.total_labels = {}
+        for col, (key, label, color) in enumerate([
+            ("totalSpent", "Spent", COLORS["spent"]),
+            ("totalSaved", "Saved", COLORS["saved"]),
+            ("totalGiven", "Given", COLORS["given"])
         ]):
             totals_frame.grid_columnconfigure(col, weight=1)
             
@@ -594,15 +1027,30 @@ class KidCard(ctk.CTkFrame):
             
             ctk.CTkLabel(
                 item_frame, text=label, 
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=_font(10, "bold"),
                 text_color=COLORS["text_muted"]
             ).pack(pady=(8, 2))
             
-            ctk.CTkLabel(
-                item_frame, text=f"€{value:.2f}",
-                font=ctk.CTkFont(size=16, weight="bold"),
+            self.total_labels[key] = ctk.CTkLabel(
+                item_frame, text=f"€{totals.get(key, 0):.2f}",
+                font=_font(16, "bold"),
                 text_color=color
-            ).pack(pady=(0, 8))
+            )
+            self.total_labels[key].pack(pady=(0, 8))
+    
+    def update_kid(self, kid: dict):
+        """Show new data for the same kid without rebuilding the card."""
+        self.kid = kid
+        _set_label_text(self.name_label, f"👦 {kid['name']}")
+        totals = kid.get("totals", {})
+        for key, label in self.total_labels.items():
+            _set_label_text(label, f"€{totals.get(key, 0):.2f}")
+
+
+@lru_cache(maxsize=8)
+def _menu_values(count: int) -> Tuple[str, ...]:
+    """Option menu values "1".."count" (shared, so unchanged lists compare by identity)."""
+    return tuple(str(i) for i in range(1, count + 1))
 
 
 class PeriodSelectorWidget(ctk.CTkFrame):
@@ -614,6 +1062,8 @@ class PeriodSelectorWidget(ctk.CTkFrame):
         
         self.period_type = period_type
         self.current_period = initial_period or PeriodHelper.get_current_period(period_type)
+        # Resolve the year default once instead of calling datetime.now() on every refresh
+        self.current_period.setdefault("year", datetime.now().year)
         self.on_change = on_change
         self.show_type_selector = show_type_selector
         self.compact = compact
@@ -645,7 +1095,7 @@ class PeriodSelectorWidget(ctk.CTkFrame):
         # Previous button
         ctk.CTkButton(
             nav_frame, text="◀", width=35, height=35,
-            command=lambda: self._navigate(-1)
+            command=self._navigate_prev
         ).pack(side="left", padx=(0, 5))
         
         # Period display
@@ -655,7 +1105,7 @@ class PeriodSelectorWidget(ctk.CTkFrame):
         self.period_label = ctk.CTkLabel(
             display_frame,
             text=self._get_display_text(),
-            font=ctk.CTkFont(size=12 if self.compact else 13, weight="bold"),
+            font=_font(12 if self.compact else 13, "bold"),
             text_color=COLORS["primary"],
             justify="center"
         )
@@ -664,19 +1114,19 @@ class PeriodSelectorWidget(ctk.CTkFrame):
         # Next button
         ctk.CTkButton(
             nav_frame, text="▶", width=35, height=35,
-            command=lambda: self._navigate(1)
+            command=self._navigate_next
         ).pack(side="left", padx=(5, 0))
         
         # Year selector for quick navigation
         year_frame = ctk.CTkFrame(self, fg_color="transparent")
         year_frame.pack(fill="x", pady=(10, 0))
         
-        ctk.CTkLabel(year_frame, text="Year:", font=ctk.CTkFont(size=11)).pack(side="left", padx=(0, 5))
+        ctk.CTkLabel(year_frame, text="Year:", font=_font(11)).pack(side="left", padx=(0, 5))
         
         current_year = datetime.now().year
         years = [str(y) for y in range(current_year - 5, current_year + 3)]
         
-        self.year_var = ctk.StringVar(value=str(self.current_period.get("year", current_year)))
+        self.year_var = ctk.StringVar(value=str(self.current_period["year"]))
         year_menu = ctk.CTkOptionMenu(
             year_frame,
             values=years,
@@ -689,32 +1139,28 @@ class PeriodSelectorWidget(ctk.CTkFrame):
         # Specific period selector
         self._create_period_selector(year_frame)
     
-    def _create_period_selector(self, parent):
-        """Create period-specific selector."""
-        self.period_var = ctk.StringVar()
-        
+    def _period_menu_spec(self) -> Tuple[str, Tuple[str, ...]]:
+        """Return the label and menu values for the current period type."""
         if self.period_type == "weekly":
-            year = self.current_period.get("year", datetime.now().year)
-            max_weeks = PeriodHelper.get_max_weeks_in_year(year)
-            values = [str(w) for w in range(1, max_weeks + 1)]
-            self.period_var.set(str(self.current_period.get("week", 1)))
-            label = "Week:"
+            year = self.current_period["year"]
+            return "Week:", _menu_values(PeriodHelper.get_max_weeks_in_year(year))
         elif self.period_type == "biweekly":
-            year = self.current_period.get("year", datetime.now().year)
-            max_biweeks = (PeriodHelper.get_max_weeks_in_year(year) + 1) // 2
-            values = [str(b) for b in range(1, max_biweeks + 1)]
-            self.period_var.set(str(self.current_period.get("biweek", 1)))
-            label = "Period:"
+            year = self.current_period["year"]
+            return "Period:", _menu_values(PeriodHelper.get_max_biweeks_in_year(year))
         elif self.period_type == "quarterly":
-            values = ["1", "2", "3", "4"]
-            self.period_var.set(str(self.current_period.get("quarter", 1)))
-            label = "Quarter:"
+            return "Quarter:", _menu_values(4)
         else:  # monthly
-            values = [str(m) for m in range(1, 13)]
-            self.period_var.set(str(self.current_period.get("month", 1)))
-            label = "Month:"
+            return "Month:", _menu_values(12)
+    
+    def _create_period_selector(self, parent):
+        """Create period-specific selector."""
+        self.period_var = ctk.StringVar()
+        self.period_var.set(str(self.current_period.get(_PERIOD_FIELDS.get(self.period_type, "month"), 1)))
+        label, values = self._period_menu_spec()
+        self._menu_values = values
         
-        ctk.CTkLabel(parent, text=label, font=ctk.CTkFont(size=11)).pack(side="left", padx=(15, 5))
+        self.period_menu_label = ctk.CTkLabel(parent, text=label, font=_font(11))
+        self.period_menu_label.pack(side="left", padx=(15, 5))
         
         self.period_menu = ctk.CTkOptionMenu(
             parent,
@@ -732,7 +1178,7 @@ class PeriodSelectorWidget(ctk.CTkFrame):
     def _update_display(self):
         """Update the period display."""
         self.period_label.configure(text=self._get_display_text())
-        self.year_var.set(str(self.current_period.get("year", datetime.now().year)))
+        self.year_var.set(str(self.current_period["year"]))
         
         # Update period selector value
         if self.period_type == "weekly":
@@ -752,25 +1198,29 @@ class PeriodSelectorWidget(ctk.CTkFrame):
         self.current_period = PeriodHelper.navigate_period(self.current_period, direction)
         self._update_display()
     
+    def _navigate_prev(self):
+        self._navigate(-1)
+    
+    def _navigate_next(self):
+        self._navigate(1)
+    
     def _on_year_change(self, value: str):
         """Handle year change."""
-        self.current_period["year"] = int(value)
+        year = int(value)
+        self.current_period["year"] = year
         
         # Validate period is within range for new year
         if self.period_type == "weekly":
-            max_weeks = PeriodHelper.get_max_weeks_in_year(int(value))
+            max_weeks = PeriodHelper.get_max_weeks_in_year(year)
             if self.current_period.get("week", 1) > max_weeks:
                 self.current_period["week"] = max_weeks
-            # Update week selector values
-            values = [str(w) for w in range(1, max_weeks + 1)]
-            self.period_menu.configure(values=values)
         elif self.period_type == "biweekly":
-            max_biweeks = (PeriodHelper.get_max_weeks_in_year(int(value)) + 1) // 2
+            max_biweeks = PeriodHelper.get_max_biweeks_in_year(year)
             if self.current_period.get("biweek", 1) > max_biweeks:
                 self.current_period["biweek"] = max_biweeks
-            values = [str(b) for b in range(1, max_biweeks + 1)]
-            self.period_menu.configure(values=values)
         
+        # Week/biweek counts differ between years; the menu is only redrawn when they do
+        self._set_menu_values(self._period_menu_spec()[1])
         self._update_display()
     
     def _on_period_select(self, value: str):
@@ -788,16 +1238,29 @@ class PeriodSelectorWidget(ctk.CTkFrame):
     
     def _on_type_change(self, value: str):
         """Handle period type change."""
-        self.period_type = value
-        self.current_period = PeriodHelper.get_current_period(value)
+        self.set_type(value)
+    
+    def set_type(self, period_type: str, period: dict = None):
+        """Switch to another period type, reusing the widgets.
         
-        # Rebuild the selector
-        for widget in self.winfo_children():
-            widget.destroy()
-        self._create_widgets()
+        Starts at period if given, otherwise at the current period of that type.
+        """
+        self.period_type = period_type
+        self.current_period = period or PeriodHelper.get_current_period(period_type)
+        self.current_period.setdefault("year", datetime.now().year)
+        if self.show_type_selector:
+            self.type_var.set(period_type)
         
-        if self.on_change:
-            self.on_change(self.current_period)
+        label, values = self._period_menu_spec()
+        self.period_menu_label.configure(text=label)
+        self._set_menu_values(values)
+        self._update_display()
+    
+    def _set_menu_values(self, values: Tuple[str, ...]):
+        """Update the period menu values, skipping the redraw if they haven't changed."""
+        if values is not self._menu_values:
+            self.period_menu.configure(values=values)
+            self._menu_values = values
     
     def get_period(self) -> dict:
         """Get current period."""
@@ -814,22 +1277,128 @@ class PeriodSelectorWidget(ctk.CTkFrame):
     def set_period(self, period: dict):
         """Set the current period."""
         self.current_period = period
+        self.current_period.setdefault("year", datetime.now().year)
         self.period_type = period["type"]
         self._update_display()
 
 
+class AllocationRow(tk.Frame):
+    """Spent/Saved/Given/Interest inputs drawn on a single canvas.
+    
+    Captions and input boxes are canvas items and the inputs are plain
+    tk.Entry widgets, instead of a CTk frame, label and entry (each with
+    its own canvas) per field.
+    """
+    
+    FIELDS = (
+        ("spent", "🛒 Spent %", COLORS["spent"]),
+        ("saved", "🏦 Saved %", COLORS["saved"]),
+        ("given", "🎁 Given %", COLORS["given"]),
+        ("interest", "📈 Interest %", COLORS["primary"]),
+    )
+    
+    def __init__(self, parent, values: dict, bg: str, entry_width: int = 55,
+                 font_size: int = 10, on_key=None):
+        super().__init__(parent, bg=bg, highlightthickness=0)
+        self.entries = {}
+        self._items = []
+        
+        # Plain Tk widgets don't follow CTk's widget scaling, so scale sizes
+        # and fonts the way CTk does (negative sizes are pixels) and size
+        # the rows from the font metrics. The scaling comes from the CTk
+        # parent, the same way CTk widgets read their own; 1.0 otherwise
+        get_scaling = getattr(parent, "_get_widget_scaling", None)
+        scale = get_scaling() if callable(get_scaling) else 1.0
+        caption_font = tkfont.Font(self, family="", size=-round(font_size * scale))
+        entry_font = tkfont.Font(self, family="", size=-round((font_size + 2) * scale))
+        pad = round(4 * scale)
+        border = max(1, round(2 * scale))
+        caption_h = caption_font.metrics("linespace")
+        entry_h = entry_font.metrics("linespace") + pad
+        self.entry_width = round(entry_width * scale)
+        self._caption_y = pad + caption_h / 2
+        self._box_top = 2 * pad + caption_h
+        self._box_bottom = self._box_top + entry_h + 2 * (border + 1)
+        # Tk deletes a named font once its Font object is collected
+        self._fonts = (caption_font, entry_font)
+        
+        self.canvas = tk.Canvas(self, height=self._box_bottom + pad, bg=bg, highlightthickness=0)
+        self.canvas.pack(fill="x")
+        
+        for key, label, color in self.FIELDS:
+            caption = self.canvas.create_text(
+                0, self._caption_y, text=label, font=caption_font, fill=COLORS["text"]
+            )
+            box = self.canvas.create_rectangle(
+                0, 0, 0, 0, outline=color, fill=COLORS["card_bg"], width=border
+            )
+            entry = tk.Entry(
+                self.canvas, justify="center", relief="flat", borderwidth=0,
+                font=entry_font, bg=COLORS["card_bg"], fg=COLORS["text"],
+                highlightthickness=0
+            )
+            entry.insert(0, str(values.get(key, 0)))
+            if on_key is not None:
+                entry.bind("<KeyRelease>", on_key)
+            window = self.canvas.create_window(
+                0, 0, window=entry, width=self.entry_width - 4 * border, height=entry_h
+            )
+            self.entries[key] = entry
+            self._items.append((caption, box, window))
+        
+        self.canvas.bind("<Configure>", self._layout)
+    
+    def _layout(self, event):
+        """Spread the four fields evenly across the canvas width."""
+        cell = event.width / len(self._items)
+        half = self.entry_width / 2
+        for i, (caption, box, window) in enumerate(self._items):
+            x = cell * (i + 0.5)
+            self.canvas.coords(caption, x, self._caption_y)
+            self.canvas.coords(box, x - half, self._box_top, x + half, self._box_bottom)
+            self.canvas.coords(window, x, (self._box_top + self._box_bottom) / 2)
+    
+    def get(self, key: str) -> str:
+        """Current text of one of the inputs."""
+        return self.entries[key].get()
+
+
 class EditEntryDialog(ctk.CTkToplevel):
-    """Dialog for editing an entry."""
+    """Dialog for editing an entry.
+    
+    Use EditEntryDialog.open(): a single instance is kept per application
+    and closing only hides it, so later edits rebind the existing widgets.
+    """
+    
+    _instance = None
+    
+    @classmethod
+    def open(cls, parent, entry: dict, on_save, period_type: str = "monthly",
+             available_saved_before_entry: float = 0) -> "EditEntryDialog":
+        """Show the dialog for entry, reusing the hidden instance if there is one."""
+        dialog = cls._instance
+        if dialog is None or not dialog.winfo_exists():
+            dialog = cls._instance = cls(
+                parent.winfo_toplevel(), entry, on_save, period_type, available_saved_before_entry
+            )
+        else:
+            dialog._rebind(entry, on_save, period_type, available_saved_before_entry)
+            dialog.deiconify()
+            dialog._center_window()
+            dialog.lift()
+            dialog.grab_set()
+        return dialog
     
     def __init__(self, parent, entry: dict, on_save, period_type: str = "monthly", 
                  available_saved_before_entry: float = 0):
         super().__init__(parent)
         
-        self.entry = entry
-        self.on_save = on_save
-        self.period_type = entry.get("periodType", period_type)
-        # Available saved is what was available BEFORE this entry + what this entry saved - what was used
-        self.available_saved = available_saved_before_entry + entry.get("saved", 0)
+        self._bind_entry(entry, on_save, period_type, available_saved_before_entry)
+        self._summary_after_id = None
+        # Allocation and Summary widgets are created the first time their tab is shown
+        self.spent_entry = self.saved_entry = self.given_entry = self.interest_entry = None
+        self.total_label = None
+        self.summary_labels = {}
         
         self.title("Edit Entry")
         self.geometry("500x750")
@@ -838,10 +1407,49 @@ class EditEntryDialog(ctk.CTkToplevel):
         # Make modal
         self.transient(parent)
         self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._close)
         
         self._create_widgets()
         self._center_window()
     
+    def _bind_entry(self, entry: dict, on_save, period_type: str, available_saved_before_entry: float):
+        self.entry = entry
+        self.on_save = on_save
+        self.period_type = entry.get("periodType", period_type)
+        # Available saved is what was available BEFORE this entry + what this entry saved - what was used
+        self.available_saved = available_saved_before_entry + entry.get("saved", 0)
+    
+    def _rebind(self, entry: dict, on_save, period_type: str, available_saved_before_entry: float):
+        """Point the existing widgets at another entry instead of rebuilding them."""
+        self._bind_entry(entry, on_save, period_type, available_saved_before_entry)
+        
+        existing_period = PeriodHelper.parse_period_key(entry["period"])
+        self.period_selector.set_type(existing_period["type"], existing_period)
+        self._set_text(self.amount_entry, entry["amount"])
+        self._set_text(self.used_from_saved_entry, entry.get("usedFromSaved", 0))
+        self.max_saved_label.configure(text=f"(Max: €{self.available_saved:.2f})")
+        if self.spent_entry is not None:
+            self._set_text(self.spent_entry, entry.get("spentPercent", 40))
+            self._set_text(self.saved_entry, entry.get("savedPercent", 40))
+            self._set_text(self.given_entry, entry.get("givenPercent", 20))
+            self._set_text(self.interest_entry, entry.get("interestRate", 0))
+        
+        self.tabview.set("Basics")
+        self._update_summary_now()
+    
+    @staticmethod
+    def _set_text(entry, value):
+        entry.delete(0, "end")
+        entry.insert(0, str(value))
+    
+    def _close(self):
+        """Hide the dialog so the next edit can reuse it."""
+        if self._summary_after_id:
+            self.after_cancel(self._summary_after_id)
+            self._summary_after_id = None
+        self.grab_release()
+        self.withdraw()
+    
     def _center_window(self):
         self.update_idletasks()
         x = (self.winfo_screenwidth() - 500) // 2
@@ -849,22 +1457,58 @@ class EditEntryDialog(ctk.CTkToplevel):
         self.geometry(f"+{x}+{y}")
     
     def _create_widgets(self):
-        main_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
         # Title
         ctk.CTkLabel(
-            main_frame, text="📝 Edit Entry",
-            font=ctk.CTkFont(size=20, weight="bold")
-        ).pack(pady=(0, 15))
+            self, text="📝 Edit Entry",
+            font=_font(20, "bold")
+        ).pack(pady=(20, 10))
+        
+        # Buttons (packed before the tabs so they stay at the bottom)
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(side="bottom", fill="x", padx=20, pady=(0, 20))
+        
+        ctk.CTkButton(
+            btn_frame, text="Cancel", width=100,
+            fg_color=COLORS["text_muted"], hover_color="#475569",
+            command=self._close
+        ).pack(side="right", padx=5)
+        
+        ctk.CTkButton(
+            btn_frame, text="Save Changes", width=120,
+            fg_color=COLORS["primary"], hover_color=COLORS["primary_hover"],
+            command=self._save
+        ).pack(side="right")
+        
+        self.tabview = ctk.CTkTabview(self, command=self._on_tab_change)
+        self.tabview.pack(fill="both", expand=True, padx=20, pady=(0, 10))
         
+        self._tab_builders = {
+            "Basics": self._create_basics_tab,
+            "Allocation": self._create_allocation_tab,
+            "Summary": self._create_summary_tab,
+        }
+        for name in self._tab_builders:
+            self.tabview.add(name)
+        self._on_tab_change()
+    
+    def _on_tab_change(self):
+        """Create the selected tab's widgets the first time it is shown."""
+        name = self.tabview.get()
+        build = self._tab_builders.pop(name, None)
+        if build is None:
+            return
+        tab = self.tabview.tab(name)
+        build(tab)
+        self._update_summary_now()
+    
+    def _create_basics_tab(self, tab):
         # Period selector section
-        period_section = ctk.CTkFrame(main_frame, fg_color=COLORS["bg"], corner_radius=8)
+        period_section = ctk.CTkFrame(tab, fg_color=COLORS["bg"], corner_radius=8)
         period_section.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(
             period_section, text="📅 Period",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(anchor="w", padx=15, pady=(10, 5))
         
         # Parse existing period
@@ -880,24 +1524,23 @@ class EditEntryDialog(ctk.CTkToplevel):
         self.period_selector.pack(fill="x", padx=15, pady=(0, 15))
         
         # Amount section
-        amount_section = ctk.CTkFrame(main_frame, fg_color=COLORS["bg"], corner_radius=8)
+        amount_section = ctk.CTkFrame(tab, fg_color=COLORS["bg"], corner_radius=8)
         amount_section.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(
             amount_section, text="💵 Amount (EUR)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(anchor="w", padx=15, pady=(10, 5))
         
-        self.amount_var = ctk.StringVar(value=str(self.entry["amount"]))
         self.amount_entry = ctk.CTkEntry(
-            amount_section, textvariable=self.amount_var, 
-            height=40, font=ctk.CTkFont(size=16)
+            amount_section, height=40, font=_font(16)
         )
+        self.amount_entry.insert(0, str(self.entry["amount"]))
         self.amount_entry.pack(fill="x", padx=15, pady=(0, 15))
-        self.amount_var.trace_add("write", lambda *args: self._update_summary())
+        self.amount_entry.bind("<KeyRelease>", self._schedule_summary)
         
         # Used from Saved section
-        used_section = ctk.CTkFrame(main_frame, fg_color=COLORS["bg"], corner_radius=8)
+        used_section = ctk.CTkFrame(tab, fg_color=COLORS["bg"], corner_radius=8)
         used_section.pack(fill="x", pady=(0, 15))
         
         used_header = ctk.CTkFrame(used_section, fg_color="transparent")
@@ -905,77 +1548,77 @@ class EditEntryDialog(ctk.CTkToplevel):
         
         ctk.CTkLabel(
             used_header, text="💸 Used from Saved (EUR)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(side="left")
         
-        ctk.CTkLabel(
+        self.max_saved_label = ctk.CTkLabel(
             used_header, 
             text=f"(Max: €{self.available_saved:.2f})",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color=COLORS["text_muted"]
-        ).pack(side="right")
+        )
+        self.max_saved_label.pack(side="right")
         
-        self.used_from_saved_var = ctk.StringVar(value=str(self.entry.get("usedFromSaved", 0)))
         self.used_from_saved_entry = ctk.CTkEntry(
-            used_section, textvariable=self.used_from_saved_var, 
-            height=40, font=ctk.CTkFont(size=16)
+            used_section, height=40, font=_font(16)
         )
-        self.used_from_saved_entry.pack(fill="x", padx=15, pady=(0, 15))
-        self.used_from_saved_var.trace_add("write", lambda *args: self._update_summary())
+        self.used_from_saved_entry.insert(0, str(self.entry.get("usedFromSaved", 0)))
+        self.used_from_saved_entry.pack(fill="x", padx=15, pady=(0, 10))
+        self.used_from_saved_entry.bind("<KeyRelease>", self._schedule_summary)
         
+        # Error label for used from saved
+        self.used_error_label = ctk.CTkLabel(
+            used_section, text="",
+            font=_font(11),
+            text_color=COLORS["danger"]
+        )
+        self.used_error_label.pack(pady=(0, 5))
+    
+    def _create_allocation_tab(self, tab):
         # Allocation section
-        alloc_section = ctk.CTkFrame(main_frame, fg_color=COLORS["bg"], corner_radius=8)
+        alloc_section = ctk.CTkFrame(tab, fg_color=COLORS["bg"], corner_radius=8)
         alloc_section.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(
             alloc_section, text="📊 Allocation",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(anchor="w", padx=15, pady=(10, 5))
         
-        alloc_frame = ctk.CTkFrame(alloc_section, fg_color="transparent")
-        alloc_frame.pack(fill="x", padx=15, pady=(0, 10))
-        
-        self.spent_var = ctk.StringVar(value=str(self.entry.get("spentPercent", 40)))
-        self.saved_var = ctk.StringVar(value=str(self.entry.get("savedPercent", 40)))
-        self.given_var = ctk.StringVar(value=str(self.entry.get("givenPercent", 20)))
-        self.interest_var = ctk.StringVar(value=str(self.entry.get("interestRate", 0)))
-        
-        for i, (label, var, color) in enumerate([
-            ("🛒 Spent %", self.spent_var, COLORS["spent"]),
-            ("🏦 Saved %", self.saved_var, COLORS["saved"]),
-            ("🎁 Given %", self.given_var, COLORS["given"]),
-            ("📈 Interest %", self.interest_var, COLORS["primary"])
-        ]):
-            alloc_frame.grid_columnconfigure(i, weight=1)
-            
-            item_frame = ctk.CTkFrame(alloc_frame, fg_color="transparent")
-            item_frame.grid(row=0, column=i, padx=3)
-            
-            ctk.CTkLabel(item_frame, text=label, font=ctk.CTkFont(size=10)).pack()
-            entry = ctk.CTkEntry(item_frame, textvariable=var, width=55, justify="center")
-            entry.pack(pady=5)
-            var.trace_add("write", lambda *args: self._update_summary())
+        alloc_row = AllocationRow(
+            alloc_section,
+            {
+                "spent": self.entry.get("spentPercent", 40),
+                "saved": self.entry.get("savedPercent", 40),
+                "given": self.entry.get("givenPercent", 20),
+                "interest": self.entry.get("interestRate", 0),
+            },
+            bg=COLORS["bg"], on_key=self._schedule_summary
+        )
+        alloc_row.pack(fill="x", padx=15, pady=(0, 10))
+        entries = alloc_row.entries
+        self.spent_entry, self.saved_entry = entries["spent"], entries["saved"]
+        self.given_entry, self.interest_entry = entries["given"], entries["interest"]
         
         # Total indicator
         self.total_label = ctk.CTkLabel(
             alloc_section, text="Total: 100%",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         self.total_label.pack(pady=(0, 15))
-        
+    
+    def _create_summary_tab(self, tab):
         # Summary section
-        summary_section = ctk.CTkFrame(main_frame, fg_color=COLORS["bg"], corner_radius=8)
+        summary_section = ctk.CTkFrame(tab, fg_color=COLORS["bg"], corner_radius=8)
         summary_section.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(
             summary_section, text="📋 Summary",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(anchor="w", padx=15, pady=(10, 5))
         
         summary_frame = ctk.CTkFrame(summary_section, fg_color="transparent")
         summary_frame.pack(fill="x", padx=15, pady=(0, 15))
         
-        self.summary_labels = {}
         for i, (label, color) in enumerate([
             ("Spent", COLORS["spent"]),
             ("Saved", COLORS["saved"]),
@@ -987,67 +1630,84 @@ class EditEntryDialog(ctk.CTkToplevel):
             item_frame = ctk.CTkFrame(summary_frame, fg_color=COLORS["card_bg"], corner_radius=8)
             item_frame.grid(row=0, column=i, padx=3, sticky="ew")
             
-            ctk.CTkLabel(item_frame, text=label, font=ctk.CTkFont(size=10)).pack(pady=(8, 2))
+            ctk.CTkLabel(item_frame, text=label, font=_font(10)).pack(pady=(8, 2))
             self.summary_labels[label.lower()] = ctk.CTkLabel(
                 item_frame, text="€0.00",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=_font(12, "bold"),
                 text_color=color
             )
             self.summary_labels[label.lower()].pack(pady=(0, 8))
-        
-        # Error label for used from saved
-        self.used_error_label = ctk.CTkLabel(
-            main_frame, text="",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["danger"]
-        )
-        self.used_error_label.pack(pady=(0, 5))
-        
-        # Buttons
-        btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        btn_frame.pack(fill="x", pady=(10, 0))
-        
-        ctk.CTkButton(
-            btn_frame, text="Cancel", width=100,
-            fg_color=COLORS["text_muted"], hover_color="#475569",
-            command=self.destroy
-        ).pack(side="right", padx=5)
-        
-        ctk.CTkButton(
-            btn_frame, text="Save Changes", width=120,
-            fg_color=COLORS["primary"], hover_color=COLORS["primary_hover"],
-            command=self._save
-        ).pack(side="right")
-        
-        self._update_summary()
     
-    def _update_summary(self):
+    def _field_text(self, entry, key: str, default: float) -> str:
+        """Text of an allocation field, or the stored value if its tab isn't built yet."""
+        if entry is None:
+            return str(self.entry.get(key, default))
+        return entry.get()
+    
+    # Error bits returned by _parse_and_validate
+    ERR_AMOUNT, ERR_TOTAL, ERR_USED_NEGATIVE, ERR_USED_OVER = 1, 2, 4, 8
+    
+    def _parse_and_validate(self) -> Tuple[float, float, float, float, float, float, int]:
+        """Parse every field once; return the values and a bitmask of ERR_* flags.
+        
+        Empty fields count as 0; raises ValueError if a field isn't a number.
+        """
+        amount = _parse_float(self.amount_entry.get() or "0")
+        spent_pct = _parse_float(self._field_text(self.spent_entry, "spentPercent", 40) or "0")
+        saved_pct = _parse_float(self._field_text(self.saved_entry, "savedPercent", 40) or "0")
+        given_pct = _parse_float(self._field_text(self.given_entry, "givenPercent", 20) or "0")
+        interest_rate = _parse_float(self._field_text(self.interest_entry, "interestRate", 0) or "0")
+        used_from_saved = _parse_float(self.used_from_saved_entry.get() or "0")
+        
+        errors = ((amount <= 0)
+                  | (abs(spent_pct + saved_pct + given_pct - 100) > 0.01) << 1
+                  | (used_from_saved < 0) << 2
+                  | (used_from_saved > self.available_saved) << 3)
+        return amount, spent_pct, saved_pct, given_pct, interest_rate, used_from_saved, errors
+    
+    def _error_message(self, errors: int) -> str:
+        """Message for the first error set in an ERR_* bitmask."""
+        first = errors & -errors
+        if first == self.ERR_AMOUNT:
+            return "Amount must be greater than 0"
+        elif first == self.ERR_TOTAL:
+            return "Allocation must total 100%"
+        elif first == self.ERR_USED_NEGATIVE:
+            return "Used from Saved cannot be negative"
+        return f"Cannot use more than available saved (€{self.available_saved:.2f})"
+    
+    def _schedule_summary(self, *args):
+        """Recompute the summary once typing pauses instead of on every keystroke."""
+        if self._summary_after_id:
+            self.after_cancel(self._summary_after_id)
+        self._summary_after_id = self.after(60, self._update_summary_now)
+    
+    def _update_summary_now(self):
+        self._summary_after_id = None
         try:
-            amount = float(self.amount_var.get() or 0)
-            spent_pct = float(self.spent_var.get() or 0)
-            saved_pct = float(self.saved_var.get() or 0)
-            given_pct = float(self.given_var.get() or 0)
-            used_from_saved = float(self.used_from_saved_var.get() or 0)
+            amount, spent_pct, saved_pct, given_pct, _, used_from_saved, errors = self._parse_and_validate()
             
             total = spent_pct + saved_pct + given_pct
             
-            self.total_label.configure(text=f"Total: {total:.1f}%")
-            if abs(total - 100) > 0.01:
-                self.total_label.configure(text_color=COLORS["danger"])
-            else:
-                self.total_label.configure(text_color=COLORS["success"])
+            if self.total_label is not None:
+                self.total_label.configure(text=f"Total: {total:.1f}%")
+                if errors & self.ERR_TOTAL:
+                    self.total_label.configure(text_color=COLORS["danger"])
+                else:
+                    self.total_label.configure(text_color=COLORS["success"])
             
-            self.summary_labels["spent"].configure(text=f"€{amount * spent_pct / 100:.2f}")
-            self.summary_labels["saved"].configure(text=f"€{amount * saved_pct / 100:.2f}")
-            self.summary_labels["given"].configure(text=f"€{amount * given_pct / 100:.2f}")
-            self.summary_labels["used"].configure(text=f"-€{used_from_saved:.2f}")
+            if self.summary_labels:
+                self.summary_labels["spent"].configure(text=f"€{amount * spent_pct / 100:.2f}")
+                self.summary_labels["saved"].configure(text=f"€{amount * saved_pct / 100:.2f}")
+                self.summary_labels["given"].configure(text=f"€{amount * given_pct / 100:.2f}")
+                self.summary_labels["used"].configure(text=f"-€{used_from_saved:.2f}")
             
             # Validate used from saved
-            if used_from_saved > self.available_saved:
+            if errors & self.ERR_USED_OVER:
                 self.used_error_label.configure(
                     text=f"⚠️ Cannot exceed available saved (€{self.available_saved:.2f})"
                 )
-            elif used_from_saved < 0:
+            elif errors & self.ERR_USED_NEGATIVE:
                 self.used_error_label.configure(text="⚠️ Cannot be negative")
             else:
                 self.used_error_label.configure(text="")
@@ -1057,27 +1717,11 @@ class EditEntryDialog(ctk.CTkToplevel):
     
     def _save(self):
         try:
-            amount = float(self.amount_var.get())
-            spent_pct = float(self.spent_var.get())
-            saved_pct = float(self.saved_var.get())
-            given_pct = float(self.given_var.get())
-            interest_rate = float(self.interest_var.get())
-            used_from_saved = float(self.used_from_saved_var.get() or 0)
-            
-            if amount <= 0:
-                messagebox.showerror("Error", "Amount must be greater than 0")
-                return
+            (amount, spent_pct, saved_pct, given_pct, interest_rate,
+             used_from_saved, errors) = self._parse_and_validate()
             
-            if abs(spent_pct + saved_pct + given_pct - 100) > 0.01:
-                messagebox.showerror("Error", "Allocation must total 100%")
-                return
-            
-            if used_from_saved < 0:
-                messagebox.showerror("Error", "Used from Saved cannot be negative")
-                return
-            
-            if used_from_saved > self.available_saved:
-                messagebox.showerror("Error", f"Cannot use more than available saved (€{self.available_saved:.2f})")
+            if errors:
+                messagebox.showerror("Error", self._error_message(errors))
                 return
             
             # Get period info from selector
@@ -1089,23 +1733,188 @@ class EditEntryDialog(ctk.CTkToplevel):
                 spent_pct, saved_pct, given_pct, interest_rate,
                 used_from_saved, period_key, period_type
             )
-            self.destroy()
+            self._close()
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers")
+    
+    def destroy(self):
+        if self._summary_after_id:
+            self.after_cancel(self._summary_after_id)
+            self._summary_after_id = None
+        if EditEntryDialog._instance is self:
+            EditEntryDialog._instance = None
+        super().destroy()
             
+class ChartRenderer:
+    """Renders matplotlib charts on a background thread.
+    
+    Drawing a figure blocks for a noticeable time, so charts are rasterised
+    off the Tk thread with the Agg canvas and handed back as PIL images;
+    the Tk thread polls for finished images with after(). The last few
+    images are kept by spec, so re-showing an unchanged chart (switching
+    kids back and forth, edits that don't touch the history) skips
+    matplotlib entirely.
+    """
+    
+    POLL_MS = 30
+    CACHE_SIZE = 16
+    
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._cache = OrderedDict()
+        # Figure, Agg canvas and axes, created on the worker by the first render
+        self._figure = None
+        self._pending = 0
+        self._polling = False
+        # Started by the first chart that isn't cached
+        self._thread = None
+    
+    def submit(self, widget, spec: dict, callback):
+        """Queue a chart spec; callback(image) is later called on the Tk thread.
+        
+        A chart that is still cached is handed to callback straight away.
+        """
+        key = self._spec_key(spec)
+        image = self._cache.get(key)
+        if image is not None:
+            self._cache.move_to_end(key)
+            callback(image)
+            return
+        self._pending += 1
+        self._jobs.put((spec, key, callback))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ChartRenderer", daemon=True)
+            self._thread.start()
+        if not self._polling:
+            self._polling = True
+            root = widget.winfo_toplevel()
+            root.after(self.POLL_MS, self._poll, root)
+    
+    def _poll(self, root):
+        """Deliver finished images to their callbacks (Tk thread)."""
+        while True:
+            try:
+                callback, key, image, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            try:
+                if error is not None:
+                    raise error
+                self._cache[key] = image
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+                callback(image)
+            except Exception as e:
+                # Keep polling for the remaining charts
+                root.report_callback_exception(type(e), e, e.__traceback__)
+        if self._pending:
+            root.after(self.POLL_MS, self._poll, root)
+        else:
+            self._polling = False
+    
+    def _run(self):
+        """Worker loop: render queued specs one at a time."""
+        while True:
+            spec, key, callback = self._jobs.get()
+            try:
+                self._results.put((callback, key, self._render(spec), None))
+            except Exception as e:
+                # Re-raised on the Tk thread, like any other callback error
+                self._results.put((callback, key, None, e))
+    
+    @staticmethod
+    def _spec_key(spec: dict) -> tuple:
+        """Hashable signature of everything that affects the rendered chart."""
+        return (
+            tuple(spec["labels"]),
+            tuple((label, tuple(values), color) for label, values, color in spec["series"]),
+            spec["size"],
+            spec["scale"],
+        )
+    
+    def _render(self, spec: dict):
+        """Draw the chart described by spec and return it as a PIL image (worker thread).
+        
+        The figure and its Agg canvas are built once and reused; each chart
+        only clears and redraws the axes. spec["size"] is the display size
+        in CTk (unscaled) pixels; the image is drawn at spec["scale"] times
+        that, so it stays sharp on HiDPI screens.
+        """
+        from PIL import Image
+        
+        if self._figure is None:
+            # matplotlib is slow to import, so only load it once a chart is drawn
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            fig = Figure(dpi=100)
+            fig.patch.set_facecolor(COLORS["bg"])
+            self._figure = (fig, FigureCanvasAgg(fig), fig.add_subplot(111))
+        fig, canvas, ax = self._figure
+        # Scale the dpi rather than the size, so text keeps its size on screen
+        width, height = spec["size"]
+        fig.set_dpi(100 * spec["scale"])
+        fig.set_size_inches(width / 100, height / 100)
+        
+        import numpy as np
+        
+        labels = spec["labels"]
+        # Plot against positions rather than the label strings (which makes
+        # matplotlib build a categorical axis), and label at most ~10 ticks
+        # once the history gets long
+        x = np.arange(len(labels))
+        step = max(1, len(labels) // 10) if len(labels) > 20 else 1
+        
+        ax.clear()
+        ax.set_facecolor(COLORS["bg"])
+        
+        for label, values, color in spec["series"]:
+            ax.plot(x, values, color=color,
+                    label=label, linewidth=2, marker='o', markersize=4)
+            ax.fill_between(x, values, alpha=0.1, color=color)
+        
+        ax.set_xticks(x[::step])
+        ax.set_xticklabels(labels[::step], rotation=45, fontsize=7)
+        ax.legend(loc='upper left', fontsize=8)
+        ax.tick_params(axis='y', labelsize=8)
+        ax.grid(True, alpha=0.3)
+        
+        fig.tight_layout()
+        canvas.draw()
+        
+        width, height = canvas.get_width_height()
+        return Image.frombuffer("RGBA", (width, height), canvas.buffer_rgba(), "raw", "RGBA", 0, 1).copy()
+
+
 class KidDetailsView(ctk.CTkFrame):
     """View for displaying and managing a kid's details."""
     
-    def __init__(self, parent, data_manager: DataManager, kid_id: str, on_back, on_period_type_change=None):
+    # Height of the savings chart, in CTk (unscaled) pixels
+    CHART_HEIGHT = 300
+    
+    # History table columns as (heading, width); shared by every view
+    HISTORY_COLUMNS = (
+        ("Period", 120), ("Amount", 70), ("Spent", 80), ("Saved", 80),
+        ("Given", 80), ("Used", 70), ("Interest", 90), ("Running", 80),
+    )
+    
+    def __init__(self, parent, data_manager: DataManager, kid_id: str, on_back,
+                 on_period_type_change=None, chart_renderer: ChartRenderer = None,
+                 on_status=None):
         super().__init__(parent, fg_color="transparent")
         
         self.dm = data_manager
         self.kid_id = kid_id
         self.on_back = on_back
         self.on_period_type_change = on_period_type_change
+        self.on_status = on_status or (lambda text: messagebox.showinfo("Success", text))
+        self.invalid_field = None
+        self.chart_renderer = chart_renderer or ChartRenderer()
         self.current_period = None
         self.period_type = "monthly"
-        self.chart_canvas = None
+        self.chart_image = None
         
         self._load_kid()
         self._create_widgets()
@@ -1113,6 +1922,9 @@ class KidDetailsView(ctk.CTkFrame):
     def _load_kid(self):
         """Load kid data."""
         self.kid = self.dm.get_kid(self.kid_id)
+        # Entries come back sorted by period; index them by id for edits
+        self._entries = self.kid.get("totals", {}).get("entries", [])
+        self._entry_index = {e["id"]: i for i, e in enumerate(self._entries)}
         settings = self.dm.get_settings()
         self.period_type = settings.get("period", "monthly")
         self.current_period = PeriodHelper.get_current_period(self.period_type)
@@ -1128,7 +1940,7 @@ class KidDetailsView(ctk.CTkFrame):
         ctk.CTkLabel(
             header_inner,
             text=f"👦 {self.kid['name']}'s Pocket Money",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=COLORS["primary"]
         ).pack(side="left")
         
@@ -1170,16 +1982,7 @@ class KidDetailsView(ctk.CTkFrame):
         self.current_period = PeriodHelper.get_current_period(value)
         
         # Update the period selector
-        if hasattr(self, 'period_selector'):
-            self.period_selector.destroy()
-        
-        self.period_selector = PeriodSelectorWidget(
-            self.period_selector_container,
-            period_type=self.period_type,
-            initial_period=self.current_period,
-            on_change=self._on_period_change
-        )
-        self.period_selector.pack(fill="x")
+        self.period_selector.set_type(value)
         
         # Save settings
         self.dm.update_settings({"period": value})
@@ -1201,40 +2004,30 @@ class KidDetailsView(ctk.CTkFrame):
         
         ctk.CTkLabel(
             inner, text="📊 Default Bucket Allocation",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             inner,
             text="This is the default allocation for new entries.",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color=COLORS["text_muted"]
         ).pack(anchor="w", pady=(5, 15))
         
         # Allocation inputs
-        alloc_frame = ctk.CTkFrame(inner, fg_color="transparent")
-        alloc_frame.pack(fill="x")
-        
         allocation = self.kid.get("allocation", {"spent": 40, "saved": 40, "given": 20})
         
-        self.alloc_vars = {}
-        for i, (key, label, default) in enumerate([
-            ("spent", "🛒 Spent %", allocation.get("spent", 40)),
-            ("saved", "🏦 Saved %", allocation.get("saved", 40)),
-            ("given", "🎁 Given %", allocation.get("given", 20)),
-            ("interest", "📈 Interest %", self.kid.get("interestRate", 0))
-        ]):
-            alloc_frame.grid_columnconfigure(i, weight=1)
-            
-            item_frame = ctk.CTkFrame(alloc_frame, fg_color="transparent")
-            item_frame.grid(row=0, column=i, padx=10)
-            
-            ctk.CTkLabel(item_frame, text=label).pack()
-            
-            var = ctk.StringVar(value=str(default))
-            self.alloc_vars[key] = var
-            
-            ctk.CTkEntry(item_frame, textvariable=var, width=80, justify="center").pack(pady=5)
+        self.alloc_row = AllocationRow(
+            inner,
+            {
+                "spent": allocation.get("spent", 40),
+                "saved": allocation.get("saved", 40),
+                "given": allocation.get("given", 20),
+                "interest": self.kid.get("interestRate", 0),
+            },
+            bg=COLORS["card_bg"], entry_width=80, font_size=12
+        )
+        self.alloc_row.pack(fill="x")
         
         # Error label
         self.alloc_error = ctk.CTkLabel(inner, text="", text_color=COLORS["danger"])
@@ -1256,7 +2049,7 @@ class KidDetailsView(ctk.CTkFrame):
         
         ctk.CTkLabel(
             inner, text="💵 Add Money Entry",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(anchor="w", pady=(0, 15))
         
         # Period selector container
@@ -1296,7 +2089,7 @@ class KidDetailsView(ctk.CTkFrame):
         self.available_saved_label = ctk.CTkLabel(
             entry_frame, 
             text=f"(Available: €{available_saved:.2f})",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color=COLORS["text_muted"]
         )
         self.available_saved_label.pack(side="left", padx=(5, 0))
@@ -1318,7 +2111,7 @@ class KidDetailsView(ctk.CTkFrame):
         
         ctk.CTkLabel(
             inner, text="📈 Current Totals",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(anchor="w", pady=(0, 15))
         
         totals_frame = ctk.CTkFrame(inner, fg_color="transparent")
@@ -1340,14 +2133,14 @@ class KidDetailsView(ctk.CTkFrame):
             
             ctk.CTkLabel(
                 card, text=f"{icon} {label}",
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 text_color=COLORS["text_muted"]
             ).pack(pady=(10, 5))
             
             value = totals.get(key, 0)
             self.total_labels[key] = ctk.CTkLabel(
                 card, text=f"€{value:.2f}",
-                font=ctk.CTkFont(size=18, weight="bold"),
+                font=_font(18, "bold"),
                 text_color=color
             )
             self.total_labels[key].pack(pady=(0, 10))
@@ -1362,143 +2155,126 @@ class KidDetailsView(ctk.CTkFrame):
         
         ctk.CTkLabel(
             inner, text="📜 Transaction History",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(anchor="w", pady=(0, 15))
         
         # Entries container
         self.entries_frame = ctk.CTkFrame(inner, fg_color="transparent")
         self.entries_frame.pack(fill="x")
         
+        self.entries_tree = None
+        self.entries_empty_label = None
+        self._rendered_rows = {}
         self._render_entries()
     
-    def _render_entries(self):
-        """Render entries table."""
-        # Clear existing
-        for widget in self.entries_frame.winfo_children():
-            widget.destroy()
+    def _build_entries_table(self):
+        """Create the entries Treeview, its scrollbar and the action buttons once."""
+        style = ttk.Style(self.entries_frame)
+        style.configure("Entries.Treeview", font=("", 9), rowheight=24)
+        style.configure("Entries.Treeview.Heading", font=("", 9, "bold"))
+        
+        self.entries_table = ctk.CTkFrame(self.entries_frame, fg_color="transparent")
+        
+        tree = ttk.Treeview(
+            self.entries_table, columns=[h for h, _ in self.HISTORY_COLUMNS],
+            show="headings", style="Entries.Treeview"
+        )
+        for h, w in self.HISTORY_COLUMNS:
+            tree.heading(h, text=h)
+            tree.column(h, width=w, minwidth=w, anchor="w" if h == "Period" else "center",
+                        stretch=h == "Period")
+        tree.tag_configure("used", foreground=COLORS["danger"])
+        
+        scrollbar = ttk.Scrollbar(self.entries_table, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        # Actions work on the selected row; double-click a row to edit it
+        actions_frame = ctk.CTkFrame(self.entries_table, fg_color="transparent")
+        actions_frame.pack(side="bottom", fill="x", pady=(5, 0))
+        
+        ctk.CTkButton(
+            actions_frame, text="Delete", image=_icon("delete", 14), compound="left",
+            width=90, height=28,
+            fg_color=COLORS["danger"], hover_color="#dc2626",
+            command=self._delete_selected_entry
+        ).pack(side="right", padx=2)
         
+        ctk.CTkButton(
+            actions_frame, text="Edit", image=_icon("edit", 14), compound="left",
+            width=90, height=28,
+            fg_color=COLORS["primary"], hover_color=COLORS["primary_hover"],
+            command=self._edit_selected_entry
+        ).pack(side="right", padx=2)
+        
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+        tree.bind("<Double-1>", self._on_entry_double_click)
+        tree.bind("<Return>", self._edit_selected_entry)
+        tree.bind("<Delete>", self._delete_selected_entry)
+        self.entries_tree = tree
+    
+    def _on_entry_double_click(self, event):
+        """Edit the row under the pointer."""
+        entry_id = self.entries_tree.identify_row(event.y)
+        if entry_id:
+            self._edit_entry(entry_id)
+    
+    def _edit_selected_entry(self, event=None):
+        """Edit the entry selected in the history table."""
+        selection = self.entries_tree.selection()
+        if selection:
+            self._edit_entry(selection[0])
+    
+    def _delete_selected_entry(self, event=None):
+        """Delete the entry selected in the history table."""
+        selection = self.entries_tree.selection()
+        if selection:
+            self._delete_entry(selection[0])
+    
+    def _render_entries(self):
+        """Render entries table, touching only the rows whose values changed."""
         entries = self.kid.get("totals", {}).get("entries", [])
         
         if not entries:
-            ctk.CTkLabel(
-                self.entries_frame,
-                text="No entries yet. Add your first entry above!",
-                text_color=COLORS["text_muted"]
-            ).pack(pady=20)
+            if self.entries_tree is not None:
+                self.entries_table.pack_forget()
+            if self.entries_empty_label is None:
+                self.entries_empty_label = ctk.CTkLabel(
+                    self.entries_frame,
+                    text="No entries yet. Add your first entry above!",
+                    text_color=COLORS["text_muted"]
+                )
+            self.entries_empty_label.pack(pady=20)
             return
         
-        # Header
-        header_frame = ctk.CTkFrame(self.entries_frame, fg_color=COLORS["bg"], corner_radius=8)
-        header_frame.pack(fill="x", pady=(0, 5))
+        if self.entries_empty_label is not None:
+            self.entries_empty_label.pack_forget()
+        if self.entries_tree is None:
+            self._build_entries_table()
+        tree = self.entries_tree
+        tree.configure(height=min(len(entries), 15))
+        self.entries_table.pack(fill="x")
+        
+        # Display strings are formatted by the DataManager, once per change
+        used_tags, no_tags = ("used",), ()
+        rows = {
+            entry_id: (values, used_tags if used else no_tags)
+            for entry_id, values, used in self.dm.get_entry_rows(self.kid_id)
+        }
         
-        headers = ["Period", "Amount", "Spent", "Saved", "Given", "Used", "Interest", "Running", "Actions"]
-        widths = [120, 70, 70, 70, 70, 70, 70, 80, 80]
-        for i, (h, w) in enumerate(zip(headers, widths)):
-            header_frame.grid_columnconfigure(i, weight=1 if i == 0 else 0)
-            ctk.CTkLabel(
-                header_frame, text=h,
-                font=ctk.CTkFont(size=9, weight="bold"),
-                text_color=COLORS["text_muted"],
-                width=w
-            ).grid(row=0, column=i, padx=1, pady=8)
-        
-        # Entries (sorted by period descending)
-        sorted_entries = sorted(entries, key=lambda x: x["period"], reverse=True)
-        
-        for entry in sorted_entries:
-            row_frame = ctk.CTkFrame(self.entries_frame, fg_color="transparent")
-            row_frame.pack(fill="x", pady=2)
-            
-            for i in range(9):
-                row_frame.grid_columnconfigure(i, weight=1 if i == 0 else 0)
-            
-            # Period with dates
-            period_text = PeriodHelper.format_period_short(entry["period"])
-            ctk.CTkLabel(
-                row_frame,
-                text=period_text,
-                font=ctk.CTkFont(size=9, weight="bold"),
-                width=120
-            ).grid(row=0, column=0, padx=1, pady=5, sticky="w")
-            
-            # Amount
-            ctk.CTkLabel(
-                row_frame, text=f"€{entry['amount']:.2f}",
-                font=ctk.CTkFont(size=9, weight="bold"),
-                width=70
-            ).grid(row=0, column=1, padx=1, pady=5)
-            
-            # Spent
-            ctk.CTkLabel(
-                row_frame,
-                text=f"{entry.get('spentPercent', 0):.0f}%\n€{entry['spent']:.2f}",
-                font=ctk.CTkFont(size=8),
-                text_color=COLORS["spent"],
-                width=70
-            ).grid(row=0, column=2, padx=1, pady=5)
-            
-            # Saved
-            ctk.CTkLabel(
-                row_frame,
-                text=f"{entry.get('savedPercent', 0):.0f}%\n€{entry['saved']:.2f}",
-                font=ctk.CTkFont(size=8),
-                text_color=COLORS["saved"],
-                width=70
-            ).grid(row=0, column=3, padx=1, pady=5)
-            
-            # Given
-            ctk.CTkLabel(
-                row_frame,
-                text=f"{entry.get('givenPercent', 0):.0f}%\n€{entry['given']:.2f}",
-                font=ctk.CTkFont(size=8),
-                text_color=COLORS["given"],
-                width=70
-            ).grid(row=0, column=4, padx=1, pady=5)
-            
-            # Used from Saved
-            used_from_saved = entry.get('usedFromSaved', 0)
-            ctk.CTkLabel(
-                row_frame,
-                text=f"-€{used_from_saved:.2f}" if used_from_saved > 0 else "€0.00",
-                font=ctk.CTkFont(size=9, weight="bold" if used_from_saved > 0 else "normal"),
-                text_color=COLORS["danger"] if used_from_saved > 0 else COLORS["text_muted"],
-                width=70
-            ).grid(row=0, column=5, padx=1, pady=5)
-            
-            # Interest
-            ctk.CTkLabel(
-                row_frame,
-                text=f"{entry.get('interestRate', 0):.1f}%\n+€{entry.get('interestEarned', 0):.2f}",
-                font=ctk.CTkFont(size=8),
-                text_color=COLORS["success"],
-                width=70
-            ).grid(row=0, column=6, padx=1, pady=5)
-            
-            # Running saved
-            ctk.CTkLabel(
-                row_frame,
-                text=f"€{entry.get('runningSaved', 0):.2f}",
-                font=ctk.CTkFont(size=9, weight="bold"),
-                text_color=COLORS["primary"],
-                width=80
-            ).grid(row=0, column=7, padx=1, pady=5)
-            
-            # Actions
-            actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent", width=80)
-            actions_frame.grid(row=0, column=8, padx=1, pady=5)
-            
-            entry_id = entry["id"]
-            ctk.CTkButton(
-                actions_frame, text="✏️", width=28, height=24,
-                fg_color=COLORS["primary"], hover_color=COLORS["primary_hover"],
-                command=lambda eid=entry_id: self._edit_entry(eid)
-            ).pack(side="left", padx=1)
-            
-            ctk.CTkButton(
-                actions_frame, text="🗑️", width=28, height=24,
-                fg_color=COLORS["danger"], hover_color="#dc2626",
-                command=lambda eid=entry_id: self._delete_entry(eid)
-            ).pack(side="left", padx=1)
+        removed = [iid for iid in self._rendered_rows if iid not in rows]
+        if removed:
+            tree.delete(*removed)
+        for index, (iid, row) in enumerate(rows.items()):
+            old = self._rendered_rows.get(iid)
+            if old is None:
+                tree.insert("", index, iid=iid, values=row[0], tags=row[1])
+                continue
+            if old != row:
+                tree.item(iid, values=row[0], tags=row[1])
+            if tree.index(iid) != index:
+                tree.move(iid, "", index)
+        self._rendered_rows = rows
     
     def _create_chart_section(self):
         """Create chart section."""
@@ -1510,122 +2286,137 @@ class KidDetailsView(ctk.CTkFrame):
         
         ctk.CTkLabel(
             inner, text="📊 Savings Evolution",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(anchor="w", pady=(0, 15))
         
-        self.chart_frame = ctk.CTkFrame(inner, fg_color=COLORS["bg"], corner_radius=8, height=300)
+        self.chart_frame = ctk.CTkFrame(inner, fg_color=COLORS["bg"], corner_radius=8,
+                                        height=self.CHART_HEIGHT)
         self.chart_frame.pack(fill="x")
         self.chart_frame.pack_propagate(False)
+        # The chart is drawn to the frame's width; redraw it once resizing pauses
+        self._chart_after_id = None
+        self.chart_frame.bind("<Configure>", self._on_chart_resize)
+        
+        self.chart_label = ctk.CTkLabel(self.chart_frame, text="")
+        self.chart_empty_label = ctk.CTkLabel(
+            self.chart_frame,
+            text="No data to display",
+            text_color=COLORS["text_muted"]
+        )
         
         self._update_chart()
     
     def _update_chart(self):
-        """Update the savings chart."""
-        # Clear existing chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-        
+        """Update the savings chart (rendered in the background)."""
         entries = self.kid.get("totals", {}).get("entries", [])
         
         if not entries:
-            ctk.CTkLabel(
-                self.chart_frame,
-                text="No data to display",
-                text_color=COLORS["text_muted"]
-            ).pack(expand=True)
+            self.chart_label.pack_forget()
+            self.chart_empty_label.pack(expand=True)
             return
         
-        sorted_entries = sorted(entries, key=lambda x: x["period"])
-        
-        labels = [PeriodHelper.format_period_short(e["period"]) for e in sorted_entries]
-        
-        cumulative_spent = []
-        cumulative_given = []
-        saved_data = []
-        
-        cum_spent = 0
-        cum_given = 0
-        
-        for entry in sorted_entries:
-            cum_spent += entry["spent"]
-            cum_given += entry["given"]
-            cumulative_spent.append(cum_spent)
-            cumulative_given.append(cum_given)
-            saved_data.append(entry.get("runningSaved", 0))
-        
-        # Create matplotlib figure
-        fig = Figure(figsize=(8, 3), dpi=100)
-        fig.patch.set_facecolor(COLORS["bg"])
-        
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(COLORS["bg"])
-        
-        ax.plot(labels, cumulative_spent, color=COLORS["spent"], 
-                label="Cumulative Spent", linewidth=2, marker='o', markersize=4)
-        ax.fill_between(labels, cumulative_spent, alpha=0.1, color=COLORS["spent"])
-        
-        ax.plot(labels, saved_data, color=COLORS["saved"],
-                label="Total Saved", linewidth=2, marker='o', markersize=4)
-        ax.fill_between(labels, saved_data, alpha=0.1, color=COLORS["saved"])
+        width = self.chart_frame.winfo_width()
+        if width <= 1:
+            # Not laid out yet; <Configure> draws the chart once it is
+            return
+        scale = self._get_widget_scaling()
+        series = self.dm.get_chart_series(self.kid_id)
+        
+        self.chart_renderer.submit(self, {
+            "labels": series["labels"],
+            "series": [
+                ("Cumulative Spent", series["cum_spent"], COLORS["spent"]),
+                ("Total Saved", series["saved"], COLORS["saved"]),
+                ("Cumulative Given", series["cum_given"], COLORS["given"]),
+            ],
+            "size": (round(width / scale), self.CHART_HEIGHT),
+            "scale": scale,
+        }, self._show_chart)
+    
+    def _on_chart_resize(self, event=None):
+        """Redraw the chart at the new width once the window stops resizing."""
+        if self._chart_after_id:
+            self.after_cancel(self._chart_after_id)
+        self._chart_after_id = self.after(150, self._resize_chart)
+    
+    def _resize_chart(self):
+        self._chart_after_id = None
+        if self.chart_frame.winfo_exists():
+            self._update_chart()
+    
+    def _show_chart(self, image):
+        """Display a rendered chart image (called on the Tk thread)."""
+        if not self.chart_label.winfo_exists():
+            return
+        # The image is already at screen resolution; CTkImage scales size back up
+        scale = self._get_widget_scaling()
+        self.chart_image = ctk.CTkImage(light_image=image, size=(image.width / scale, image.height / scale))
+        self.chart_label.configure(image=self.chart_image)
+        self.chart_empty_label.pack_forget()
+        self.chart_label.pack(fill="both", expand=True)
+    
+    def _save_allocation(self):
+        """Save allocation settings."""
+        values = self._parse_floats(
+            ("Spent", self.alloc_row.get("spent")),
+            ("Saved", self.alloc_row.get("saved")),
+            ("Given", self.alloc_row.get("given")),
+            ("Interest", self.alloc_row.get("interest")),
+        )
+        if values is None:
+            self.alloc_error.configure(text=f"Please enter a valid number for {self.invalid_field}")
+            return
+        spent, saved, given, interest = values
         
-        ax.plot(labels, cumulative_given, color=COLORS["given"],
-                label="Cumulative Given", linewidth=2, marker='o', markersize=4)
-        ax.fill_between(labels, cumulative_given, alpha=0.1, color=COLORS["given"])
+        if abs(spent + saved + given - 100) > 0.01:
+            self.alloc_error.configure(
+                text=f"Total must be 100% (currently {spent + saved + given:.1f}%)"
+            )
+            return
         
-        ax.legend(loc='upper left', fontsize=8)
-        ax.tick_params(axis='x', rotation=45, labelsize=7)
-        ax.tick_params(axis='y', labelsize=8)
-        ax.grid(True, alpha=0.3)
+        self.alloc_error.configure(text="")
         
-        fig.tight_layout()
+        self.dm.update_allocation(self.kid_id, spent, saved, given, interest)
+        self.kid["allocation"] = {"spent": spent, "saved": saved, "given": given}
+        self.kid["interestRate"] = interest
         
-        canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.on_status("Default allocation saved ✓")
     
-    def _save_allocation(self):
-        """Save allocation settings."""
-        try:
-            spent = float(self.alloc_vars["spent"].get())
-            saved = float(self.alloc_vars["saved"].get())
-            given = float(self.alloc_vars["given"].get())
-            interest = float(self.alloc_vars["interest"].get())
-            
-            if abs(spent + saved + given - 100) > 0.01:
-                self.alloc_error.configure(
-                    text=f"Total must be 100% (currently {spent + saved + given:.1f}%)"
-                )
-                return
-            
-            self.alloc_error.configure(text="")
-            
-            self.dm.update_allocation(self.kid_id, spent, saved, given, interest)
-            self.kid["allocation"] = {"spent": spent, "saved": saved, "given": given}
-            self.kid["interestRate"] = interest
-            
-            messagebox.showinfo("Success", "Default allocation saved!")
-        except ValueError:
-            self.alloc_error.configure(text="Please enter valid numbers")
+    def _parse_floats(self, *fields) -> Optional[Tuple[float, ...]]:
+        """Parse (name, text) pairs as numbers, "," allowed as the decimal separator.
+        
+        Returns None if a field isn't a number and leaves its name in
+        self.invalid_field.
+        """
+        values = []
+        for name, text in fields:
+            try:
+                values.append(_parse_float(text))
+            except ValueError:
+                self.invalid_field = name
+                return None
+        self.invalid_field = None
+        return tuple(values)
     
     def _add_entry(self):
         """Add a new entry."""
-        try:
-            amount = float(self.amount_var.get())
-            if amount <= 0:
+        values = self._parse_floats(
+            ("Amount", self.amount_var.get()),
+            ("Used from Saved", self.used_from_saved_var.get() or "0"),
+        )
+        if values is None:
+            if self.invalid_field == "Amount":
                 messagebox.showerror("Error", "Please enter a valid amount")
-                return
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid amount")
+            else:
+                messagebox.showerror("Error", "Please enter a valid amount for Used from Saved")
             return
+        amount, used_from_saved = values
         
-        # Validate used from saved
-        try:
-            used_from_saved = float(self.used_from_saved_var.get() or 0)
-            if used_from_saved < 0:
-                messagebox.showerror("Error", "Used from Saved cannot be negative")
-                return
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid amount for Used from Saved")
+        if amount <= 0:
+            messagebox.showerror("Error", "Please enter a valid amount")
+            return
+        if used_from_saved < 0:
+            messagebox.showerror("Error", "Used from Saved cannot be negative")
             return
         
         # Check available saved
@@ -1652,29 +2443,23 @@ class KidDetailsView(ctk.CTkFrame):
         self.amount_var.set("")
         self.used_from_saved_var.set("0")
         self._refresh()
-        messagebox.showinfo("Success", "Entry added!")
+        self.on_status("Entry added ✓")
     
     def _edit_entry(self, entry_id: str):
         """Open edit entry dialog."""
-        entries = self.kid.get("totals", {}).get("entries", [])
-        
-        # Find the entry and calculate available saved at that point
-        sorted_entries = sorted(entries, key=lambda x: x["period"])
-        available_saved_before = 0
-        target_entry = None
+        index = self._entry_index.get(entry_id)
+        if index is None:
+            return
         
-        for entry in sorted_entries:
-            if entry["id"] == entry_id:
-                target_entry = entry
-                break
-            # Calculate running saved up to this point
-            available_saved_before = entry.get("runningSaved", 0)
+        # Saved money available is the running total of the previous entry
+        entries = self._entries
+        target_entry = entries[index]
+        available_saved_before = entries[index - 1].get("runningSaved", 0) if index else 0
         
-        if target_entry:
-            EditEntryDialog(
-                self, target_entry, self._save_entry_changes, 
-                self.period_type, available_saved_before
-            )
+        EditEntryDialog.open(
+            self, target_entry, self._save_entry_changes, 
+            self.period_type, available_saved_before
+        )
     
     def _save_entry_changes(self, entry_id: str, amount: float,
                            spent_pct: float, saved_pct: float,
@@ -1693,14 +2478,14 @@ class KidDetailsView(ctk.CTkFrame):
             return
         
         self._refresh()
-        messagebox.showinfo("Success", "Entry updated!")
+        self.on_status("Entry updated ✓")
     
     def _delete_entry(self, entry_id: str):
         """Delete an entry."""
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this entry?"):
             self.dm.delete_entry(self.kid_id, entry_id)
             self._refresh()
-            messagebox.showinfo("Success", "Entry deleted!")
+            self.on_status("Entry deleted ✓")
     
     def _refresh(self):
         """Refresh the view."""
@@ -1712,19 +2497,22 @@ class KidDetailsView(ctk.CTkFrame):
         # Update available saved label
         if hasattr(self, 'available_saved_label'):
             available_saved = self.kid.get("totals", {}).get("totalSaved", 0)
-            self.available_saved_label.configure(text=f"(Available: €{available_saved:.2f})")
+            _set_label_text(self.available_saved_label, f"(Available: €{available_saved:.2f})")
     
     def _update_totals(self):
-        """Update totals display."""
+        """Update totals display, leaving labels whose value didn't change alone."""
         totals = self.kid.get("totals", {})
         for key, label in self.total_labels.items():
             value = totals.get(key, 0)
-            label.configure(text=f"€{value:.2f}")
+            _set_label_text(label, f"€{value:.2f}")
 
 
 class MainApplication(ctk.CTk):
     """Main application window."""
     
+    # How often the Tk thread checks for failed background saves
+    WRITE_CHECK_MS = 500
+    
     def __init__(self):
         super().__init__()
         
@@ -1733,10 +2521,54 @@ class MainApplication(ctk.CTk):
         self.minsize(900, 650)
         
         self.dm = DataManager()
+        self.chart_renderer = ChartRenderer()
         self.current_view = None
+        self._pending = {}
         
         self._create_widgets()
         self._show_main_view()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(self.WRITE_CHECK_MS, self._check_writes)
+    
+    def _check_writes(self):
+        """Tell the user as soon as a background save fails."""
+        error = self.dm.take_write_error()
+        if error is not None:
+            messagebox.showerror(
+                "Save Failed",
+                f"Could not save your data:\n{error}\n\n"
+                "Your changes are kept and will be saved again with the next "
+                "change or when you close the app."
+            )
+        self.after(self.WRITE_CHECK_MS, self._check_writes)
+    
+    def _on_close(self):
+        """Wait for pending data writes before closing the window."""
+        try:
+            self._flush_debounced()
+            self.dm.close()
+        except Exception as e:
+            messagebox.showerror("Save Failed", f"Could not save your data:\n{e}")
+        finally:
+            self.destroy()
+    
+    def _debounced(self, key: str, ms: int, fn):
+        """Run fn once ms after the last call for key, dropping the calls before it."""
+        pending = self._pending.pop(key, None)
+        if pending:
+            self.after_cancel(pending[0])
+        def run():
+            self._pending.pop(key, None)
+            fn()
+        self._pending[key] = (self.after(ms, run), fn)
+    
+    def _flush_debounced(self, *keys):
+        """Run the waiting debounced calls for keys now, or all of them if none are given."""
+        for key in keys or list(self._pending):
+            pending = self._pending.pop(key, None)
+            if pending:
+                self.after_cancel(pending[0])
+                pending[1]()
     
     def _create_widgets(self):
         # Main container with gradient-like background
@@ -1746,6 +2578,15 @@ class MainApplication(ctk.CTk):
         # Content frame
         self.content_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
         self.content_frame.pack(fill="both", expand=True)
+        
+        # Success messages show here instead of in a modal dialog
+        self.status_label = ctk.CTkLabel(self.main_container, text="", text_color="white", height=20)
+        self.status_label.pack(fill="x", pady=(5, 0))
+    
+    def _show_status(self, text: str):
+        """Show a short confirmation in the footer and clear it after a couple of seconds."""
+        self.status_label.configure(text=text)
+        self._debounced("status", 2000, lambda: self.status_label.configure(text=""))
     
     def _show_main_view(self):
         """Show the main kids list view."""
@@ -1761,7 +2602,7 @@ class MainApplication(ctk.CTk):
         ctk.CTkLabel(
             header_inner,
             text="💰 Pocket Money Tracker",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=_font(24, "bold"),
             text_color=COLORS["primary"]
         ).pack(side="left")
         
@@ -1798,7 +2639,7 @@ class MainApplication(ctk.CTk):
         ctk.CTkLabel(
             section_inner,
             text="👨‍👩‍👧‍👦 Manage Kids",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         ).pack(anchor="w", pady=(0, 15))
         
         # Add kid form
@@ -1814,7 +2655,7 @@ class MainApplication(ctk.CTk):
             height=40
         )
         kid_entry.pack(side="left", padx=(0, 10))
-        kid_entry.bind("<Return>", lambda e: self._add_kid())
+        kid_entry.bind("<Return>", self._add_kid)
         
         ctk.CTkButton(
             add_frame, text="Add Kid", width=100, height=40,
@@ -1825,7 +2666,12 @@ class MainApplication(ctk.CTk):
         # Kids list
         self.kids_frame = ctk.CTkScrollableFrame(section_inner, fg_color="transparent")
         self.kids_frame.pack(fill="both", expand=True)
+        for col in range(3):
+            self.kids_frame.grid_columnconfigure(col, weight=1)
         
+        self._kid_cards = {}
+        self._empty_kids_frame = None
+        self._rendered_kids_sig = None
         self._render_kids()
         
         # Footer
@@ -1833,49 +2679,61 @@ class MainApplication(ctk.CTk):
             self.content_frame,
             text="Pocket Money Tracker",
             text_color="white",
-            font=ctk.CTkFont(size=11)
+            font=_font(11)
         )
         footer.pack(pady=10)
     
     def _render_kids(self):
-        """Render the kids list."""
-        for widget in self.kids_frame.winfo_children():
-            widget.destroy()
-        
+        """Render the kids list, reusing the cards of kids already shown."""
         kids = self.dm.get_kids()
         
+        # Totals dicts are cached until a kid's entries change, so an unchanged
+        # signature means every card already shows the right values
+        sig = tuple((kid["id"], kid["name"], kid["totals"]) for kid in kids)
+        if sig == self._rendered_kids_sig:
+            return
+        self._rendered_kids_sig = sig
+        
+        # Remove cards of kids that no longer exist
+        kid_ids = {kid["id"] for kid in kids}
+        for kid_id in [k for k in self._kid_cards if k not in kid_ids]:
+            self._kid_cards.pop(kid_id).destroy()
+        
         if not kids:
-            empty_frame = ctk.CTkFrame(self.kids_frame, fg_color="transparent")
-            empty_frame.pack(fill="both", expand=True, pady=50)
-            
-            ctk.CTkLabel(
-                empty_frame, text="👶",
-                font=ctk.CTkFont(size=48)
-            ).pack()
-            
-            ctk.CTkLabel(
-                empty_frame,
-                text="No kids added yet. Add your first kid above!",
-                text_color=COLORS["text_muted"]
-            ).pack(pady=10)
+            if self._empty_kids_frame is None:
+                self._empty_kids_frame = ctk.CTkFrame(self.kids_frame, fg_color="transparent")
+                self._empty_kids_frame.pack(fill="both", expand=True, pady=50)
+                
+                ctk.CTkLabel(
+                    self._empty_kids_frame, text="👶",
+                    font=_font(48)
+                ).pack()
+                
+                ctk.CTkLabel(
+                    self._empty_kids_frame,
+                    text="No kids added yet. Add your first kid above!",
+                    text_color=COLORS["text_muted"]
+                ).pack(pady=10)
             return
         
-        # Grid of kid cards
-        row_frame = None
+        if self._empty_kids_frame is not None:
+            self._empty_kids_frame.destroy()
+            self._empty_kids_frame = None
+        
+        # Grid of kid cards, three per row
         for i, kid in enumerate(kids):
-            if i % 3 == 0:
-                row_frame = ctk.CTkFrame(self.kids_frame, fg_color="transparent")
-                row_frame.pack(fill="x", pady=5)
-                for col in range(3):
-                    row_frame.grid_columnconfigure(col, weight=1)
-            
-            card = KidCard(
-                row_frame, kid,
-                on_select=self._select_kid,
-                on_edit=self._edit_kid,
-                on_delete=self._delete_kid
-            )
-            card.grid(row=0, column=i % 3, padx=5, pady=5, sticky="nsew")
+            card = self._kid_cards.get(kid["id"])
+            if card is None:
+                card = KidCard(
+                    self.kids_frame, kid,
+                    on_select=self._select_kid,
+                    on_edit=self._edit_kid,
+                    on_delete=self._delete_kid
+                )
+                self._kid_cards[kid["id"]] = card
+            else:
+                card.update_kid(kid)
+            card.grid(row=i // 3, column=i % 3, padx=5, pady=10, sticky="nsew")
     
     def _clear_content(self):
         """Clear the content frame."""
@@ -1883,10 +2741,10 @@ class MainApplication(ctk.CTk):
             widget.destroy()
     
     def _on_period_change(self, value: str):
-        """Handle period change."""
-        self.dm.update_settings({"period": value})
+        """Handle period change, saving the setting once the selection settles."""
+        self._debounced("period", 150, lambda: self.dm.update_settings({"period": value}))
     
-    def _add_kid(self):
+    def _add_kid(self, event=None):
         """Add a new kid."""
         name = self.new_kid_var.get().strip()
         if not name:
@@ -1896,16 +2754,20 @@ class MainApplication(ctk.CTk):
         self.dm.add_kid(name)
         self.new_kid_var.set("")
         self._render_kids()
-        messagebox.showinfo("Success", f"{name} has been added!")
+        self._show_status(f"{name} has been added ✓")
     
     def _select_kid(self, kid_id: str):
         """Select a kid to view details."""
+        # The details view reads the period setting, so save it first
+        self._flush_debounced("period")
         self._clear_content()
         
         details_view = KidDetailsView(
             self.content_frame, self.dm, kid_id,
             on_back=self._show_main_view,
-            on_period_type_change=lambda v: self.period_var.set(v)
+            on_period_type_change=self.period_var.set,
+            chart_renderer=self.chart_renderer,
+            on_status=self._show_status
         )
         details_view.pack(fill="both", expand=True)
     
@@ -1920,7 +2782,7 @@ class MainApplication(ctk.CTk):
         if new_name and new_name.strip():
             self.dm.update_kid(kid_id, new_name.strip())
             self._render_kids()
-            messagebox.showinfo("Success", "Name updated!")
+            self._show_status("Name updated ✓")
     
     def _delete_kid(self, kid_id: str, name: str):
         """Delete a kid."""
@@ -1930,7 +2792,7 @@ class MainApplication(ctk.CTk):
         ):
             self.dm.delete_kid(kid_id)
             self._render_kids()
-            messagebox.showinfo("Success", "Kid removed successfully")
+            self._show_status("Kid removed ✓")
 
 
 def main():
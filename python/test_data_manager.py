@@ -0,0 +1,72 @@
+"""Tests for DataManager's background writes (run from this folder with: python -m unittest)."""
+
+import json
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from main import DataManager
+
+
+class BackgroundWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.data_file = self.dir / "data.json"
+        self.dm = DataManager(str(self.data_file))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _wait_for_error(self, timeout: float = 5.0):
+        """Wait for the writer thread to report a failed write."""
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            error = self.dm.take_write_error()
+            if error is not None:
+                return error
+            time.sleep(0.01)
+        self.fail("background write did not fail")
+
+    def _block_writes(self):
+        """Make every write fail: the temp file path is taken by a directory."""
+        self.data_file.with_suffix(".json.tmp").mkdir()
+
+    def _unblock_writes(self):
+        self.data_file.with_suffix(".json.tmp").rmdir()
+
+    def test_mutator_after_failed_write_returns_normally(self):
+        self._block_writes()
+        self.dm.add_kid("a")
+        self.assertIsInstance(self._wait_for_error(), OSError)
+
+        kid = self.dm.add_kid("b")
+        self.assertEqual(kid["name"], "b")
+        self.assertEqual([k["name"] for k in self.dm.get_kids()], ["a", "b"])
+
+        self._unblock_writes()
+        self.dm.close()
+        saved = json.loads(self.data_file.read_text(encoding="utf-8"))
+        self.assertEqual([k["name"] for k in saved["kids"]], ["a", "b"])
+
+    def test_close_ignores_errors_superseded_by_a_later_write(self):
+        self._block_writes()
+        self.dm.add_kid("a")
+        time.sleep(0.2)  # let the write fail without polling the error
+        self._unblock_writes()
+        self.dm.add_kid("b")
+        self.dm.close()
+        saved = json.loads(self.data_file.read_text(encoding="utf-8"))
+        self.assertEqual([k["name"] for k in saved["kids"]], ["a", "b"])
+
+    def test_close_raises_when_last_write_cannot_be_saved(self):
+        self._block_writes()
+        self.dm.add_kid("a")
+        self._wait_for_error()
+        with self.assertRaises(OSError):
+            self.dm.close()
+
+
+if __name__ == "__main__":
+    unittest.main()